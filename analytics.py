@@ -0,0 +1,261 @@
+"""Visitor analytics: page views and clicks, buffered in memory and stored column-wise in SQLite.
+
+record() appends one tuple to a bounded ring buffer under a lock and
+returns; it never touches the disk, so logging adds about a microsecond
+to the page being viewed. A background thread flushes the buffer as soon
+as batch_size events are waiting, or every flush_interval seconds. If the
+writer ever falls behind, the oldest buffered events are dropped and
+counted.
+
+Each flush is stored as a single row of column blobs: timestamps are
+float64, and kind, page and detail are integer codes into a label table
+(dictionary encoding). Sessions are 64-bit hashes. Reading millions of
+events back is then a few np.frombuffer calls rather than millions of
+Python row tuples. load_events() returns a pandas DataFrame with
+categorical columns, and summarize() aggregates it with vectorized
+group-bys for the Analytics page.
+
+    PORTFOLIO_ANALYTICS_DB=/path/analytics.db   where events are stored
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from array import array
+from collections import deque
+
+DEFAULT_DB = os.environ.get(
+    "PORTFOLIO_ANALYTICS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "analytics.db")
+)
+
+PAGE_VIEW = "page_view"
+RESUME_DOWNLOAD = "resume_download"
+SEARCH_CLICK = "search_click"
+CONTACT_SUBMIT = "contact_submit"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS labels (
+    id INTEGER PRIMARY KEY,
+    value TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS event_batches (
+    id INTEGER PRIMARY KEY,
+    first_ts REAL NOT NULL,
+    last_ts REAL NOT NULL,
+    count INTEGER NOT NULL,
+    ts BLOB NOT NULL,       -- float64 seconds since the epoch
+    kind BLOB NOT NULL,     -- uint32 label ids
+    page BLOB NOT NULL,     -- uint32 label ids
+    session BLOB NOT NULL,  -- uint64 session hashes
+    detail BLOB NOT NULL    -- uint32 label ids
+);
+CREATE INDEX IF NOT EXISTS event_batches_last_ts ON event_batches (last_ts);
+"""
+
+logger = logging.getLogger(__name__)
+
+def session_hash(session):
+    return int.from_bytes(hashlib.blake2b(session.encode("utf-8"), digest_size=8).digest(), "little")
+
+class EventLog:
+    def __init__(self, db_path=DEFAULT_DB, capacity=100_000, batch_size=1000, flush_interval=30.0):
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self.written = 0
+        self._buffer = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # one flush at a time, in order
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+        self._conn = None
+        self._labels = {}  # value -> id, mirrors the labels table
+
+    def record(self, kind, page="", session="", detail=""):
+        event = (time.time(), kind, page, session, detail)
+        with self._lock:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wake.set()
+
+    def buffered(self):
+        with self._lock:
+            return len(self._buffer)
+
+    # Only used under _write_lock, so a single connection is enough
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._labels = {value: i for i, value in conn.execute("SELECT id, value FROM labels")}
+            self._conn = conn
+        return self._conn
+
+    def _label(self, conn, value):
+        label = self._labels.get(value)
+        if label is None:
+            # Another worker sharing the file may have added it since we loaded the table
+            conn.execute("INSERT OR IGNORE INTO labels (value) VALUES (?)", (value,))
+            label = conn.execute("SELECT id FROM labels WHERE value = ?", (value,)).fetchone()[0]
+            self._labels[value] = label
+        return label
+
+    def _write(self, batch):
+        conn = self._connect()
+        ts, kinds, pages, sessions, details = array("d"), array("I"), array("I"), array("Q"), array("I")
+        hashes = {}
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")  # other workers may write the same file
+                for t, kind, page, session, detail in batch:
+                    ts.append(t)
+                    kinds.append(self._label(conn, kind))
+                    pages.append(self._label(conn, page))
+                    details.append(self._label(conn, detail))
+                    if session not in hashes:
+                        hashes[session] = session_hash(session)
+                    sessions.append(hashes[session])
+                conn.execute(
+                    "INSERT INTO event_batches (first_ts, last_ts, count, ts, kind, page, session, detail)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (min(ts), max(ts), len(ts), ts.tobytes(), kinds.tobytes(), pages.tobytes(),
+                     sessions.tobytes(), details.tobytes()),
+                )
+        except sqlite3.Error:
+            # Labels inserted by the rolled-back transaction are gone too
+            self._labels = {value: i for i, value in conn.execute("SELECT id, value FROM labels")}
+            raise
+
+    # Write everything buffered so far as one batch; returns the number of events written
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                batch = list(self._buffer)
+                self._buffer.clear()
+            if not batch:
+                return 0
+            try:
+                self._write(batch)
+            except sqlite3.Error:
+                logger.exception("dropping %d analytics events", len(batch))
+                with self._lock:
+                    self.dropped += len(batch)
+                return 0
+            self.written += len(batch)
+            return len(batch)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def start(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._run, name="analytics-flush", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+        self.flush()
+
+# -----------------------------
+# Reading — numpy and pandas are only imported here, by the Analytics page
+# -----------------------------
+def load_events(db_path=DEFAULT_DB, since=None):
+    import numpy as np
+    import pandas as pd
+
+    columns = {"ts": [], "kind": [], "page": [], "session": [], "detail": []}
+    labels = {}
+    if os.path.exists(db_path):
+        with sqlite3.connect(db_path, timeout=5.0) as conn:
+            conn.executescript(SCHEMA)
+            labels = dict(conn.execute("SELECT id, value FROM labels"))
+            rows = conn.execute(
+                "SELECT ts, kind, page, session, detail FROM event_batches WHERE last_ts >= ? ORDER BY id",
+                (since or 0,),
+            )
+            for row in rows:
+                for name, blob in zip(columns, row):
+                    columns[name].append(blob)
+
+    def concat(blobs, dtype):
+        return np.concatenate([np.frombuffer(b, dtype=dtype) for b in blobs]) if blobs else np.empty(0, dtype)
+
+    ts = concat(columns["ts"], np.float64)
+    keep = ts >= since if since else slice(None)
+    # Label ids are rowids (1, 2, ...), so id - 1 is the category code
+    categories = [labels.get(i, f"#{i}") for i in range(1, max(labels, default=0) + 1)]
+
+    def categorical(name):
+        codes = concat(columns[name], np.uint32)[keep].astype(np.int32) - 1
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    return pd.DataFrame({
+        "ts": (ts[keep] * 1e9).astype("datetime64[ns]"),
+        "kind": categorical("kind"),
+        "page": categorical("page"),
+        "session": concat(columns["session"], np.uint64)[keep],
+        "detail": categorical("detail"),
+    })
+
+# Small, chart-ready frames; every step is a vectorized numpy/pandas operation
+def summarize(df):
+    import numpy as np
+    import pandas as pd
+
+    # Day and hour buckets straight from the datetime64 values, as small integers
+    stamps = df["ts"].to_numpy()
+    day_numbers = stamps.astype("datetime64[D]").astype("int64")
+    first_day = int(day_numbers.min()) if len(day_numbers) else 0
+    day = day_numbers - first_day
+    hour = stamps.astype("datetime64[h]").astype("int64") % 24
+    is_view = (df["kind"] == PAGE_VIEW).to_numpy()
+    page, kind = df["page"], df["kind"]
+
+    # Unique (day, session) pairs, packed into one int64 each, counted per day
+    session_codes, sessions = pd.factorize(df["session"])
+    n_sessions = max(len(sessions), 1)
+    pairs = pd.unique(day * n_sessions + session_codes)
+    visitors_per_day = np.bincount(pairs // n_sessions, minlength=int(day.max()) + 1 if len(day) else 0)
+
+    def day_labels(frame):
+        return frame.assign(day=(frame["day"] + first_day).astype("datetime64[D]"))
+
+    return {
+        "totals": {
+            "events": len(df),
+            "page_views": int(is_view.sum()),
+            "visitors": len(sessions),
+            "downloads": int((kind == RESUME_DOWNLOAD).sum()),
+        },
+        "daily_views": day_labels(
+            page[is_view].groupby([day[is_view], page[is_view]], observed=True).size()
+            .rename_axis(["day", "page"]).rename("views").reset_index()
+        ),
+        "page_views": (
+            page[is_view].value_counts().rename_axis("page").rename("views").reset_index()
+            .query("views > 0")
+        ),
+        "daily_visitors": day_labels(pd.DataFrame({"day": np.arange(len(visitors_per_day)), "visitors": visitors_per_day})),
+        "events_by_hour": (
+            kind.groupby([hour, kind], observed=True).size()
+            .rename_axis(["hour", "kind"]).rename("events").reset_index()
+        ),
+        "generated_at": pd.Timestamp.now(),
+    }
@@ -0,0 +1,214 @@
+"""ASGI entry point: the app in main.py, with long-lived cache headers for static files.
+
+Files under app/static/ whose names carry a content hash (styles.<hash>.css,
+profile.<hash>.w320.webp, resume.<hash>.pdf, ...) never change, so they are
+served with "Cache-Control: public, max-age=31536000, immutable": repeat
+visitors reuse them without even revalidating. Anything else under
+app/static/ gets "no-cache" and is revalidated with its ETag; a matching
+If-None-Match is answered with an empty 304.
+
+All assets are published once at server startup (see assets.build_manifest),
+including .br/.gz siblings for the CSS bundle. A GET for the bundle gets the
+best precompressed variant its Accept-Encoding allows. The resume is always
+served as is, with "Accept-Ranges: bytes", so a PDF viewer fetches its pages
+progressively through Streamlit's own byte-range support.
+
+After publishing, a background thread imports the app modules and fills
+every process-wide cache (components.prewarm), so the first visitor after
+a deploy gets the same first run as later ones. GET /ready answers 503
+while that is in progress and 200 afterwards, with the time each step took.
+Source file watching is off by default here: it otherwise starts a watcher
+over every imported module for each new session.
+
+Pages are sent with "Accept-CH: ECT, Save-Data", so browsers that support
+client hints report the connection quality on later requests, including
+the session's websocket; slow or data-saving connections get lite pages
+(see components.lite_mode).
+
+    streamlit run asgi.py        # or: uvicorn asgi:app
+"""
+import os
+import re
+import time
+import asyncio
+import logging
+import mimetypes
+import threading
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from streamlit import config
+from starlette.middleware import Middleware
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+import assets
+
+# <name>.<16 hex digits>[.w<width>].<ext>, as written by assets.py
+HASHED_STATIC_RE = re.compile(r"/app/static/[^/]+\.[0-9a-f]{16}(\.w\d+)?\.[a-z0-9]+$")
+
+IMMUTABLE = b"public, max-age=31536000, immutable"
+REVALIDATE = b"no-cache"
+
+logger = logging.getLogger(__name__)
+
+class StaticCacheHeaders:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or "/app/static/" not in path:
+            await self.app(scope, receive, send)
+            return
+        value = IMMUTABLE if HASHED_STATIC_RE.search(path) else REVALIDATE
+        if_none_match = dict(scope["headers"]).get(b"if-none-match")
+        not_modified = False
+
+        async def send_with_cache_control(message):
+            nonlocal not_modified
+            if message["type"] == "http.response.start":
+                if message["status"] not in (200, 206):
+                    await send(message)
+                    return
+                headers = [(k, v) for k, v in message.get("headers", []) if k.lower() != b"cache-control"]
+                headers.append((b"cache-control", value))
+                etag = dict(headers).get(b"etag")
+                if etag and if_none_match and etag in (t.strip() for t in if_none_match.split(b",")):
+                    not_modified = True
+                    headers = [(k, v) for k, v in headers if k in (b"etag", b"cache-control")]
+                    await send({"type": "http.response.start", "status": 304, "headers": headers})
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                message = dict(message, headers=headers)
+            elif not_modified:
+                return  # body of a 304: already sent empty
+            await send(message)
+
+        await self.app(scope, receive, send_with_cache_control)
+
+def accepted_encodings(header):
+    accepted = set()
+    for part in header.decode("latin-1").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+ACCEPT_CH = b"ECT, Save-Data"
+
+# Ask for the client hints lite mode reads, on everything but static files
+class ClientHints:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "/app/static/" in scope.get("path", ""):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_hints(message):
+            if message["type"] == "http.response.start":
+                message = dict(message, headers=[*message.get("headers", []), (b"accept-ch", ACCEPT_CH)])
+            await send(message)
+
+        await self.app(scope, receive, send_with_hints)
+
+# Serve <file>.br / <file>.gz in place of <file> when the client accepts it.
+# Every other static file goes out as published: the request reaches
+# Streamlit's gzip layer (which runs inside this one) without its
+# Accept-Encoding, since compressed on the fly the resume would lose the
+# byte ranges a PDF viewer needs
+class PrecompressedStatic:
+    def __init__(self, app, static_dir=assets.STATIC_DIR):
+        self.app = app
+        self.static_dir = static_dir
+
+    def _variant(self, scope):
+        path = scope.get("path", "")
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD") or "/app/static/" not in path:
+            return None
+        headers = dict(scope["headers"])
+        if b"range" in headers or b"accept-encoding" not in headers:
+            return None
+        file_name = path.rsplit("/app/static/", 1)[1]
+        if "/" in file_name or not file_name.endswith(assets.PRECOMPRESSED_SUFFIXES):
+            return None
+        accepted = accepted_encodings(headers[b"accept-encoding"])
+        for encoding, suffix in assets.ENCODINGS:
+            if encoding in accepted and os.path.isfile(os.path.join(self.static_dir, file_name + suffix)):
+                return file_name, encoding, suffix
+        return None
+
+    async def __call__(self, scope, receive, send):
+        variant = self._variant(scope)
+        if variant is None:
+            if scope["type"] == "http" and "/app/static/" in scope.get("path", ""):
+                scope = dict(scope, headers=[(k, v) for k, v in scope["headers"] if k != b"accept-encoding"])
+            await self.app(scope, receive, send)
+            return
+        file_name, encoding, suffix = variant
+        content_type = (mimetypes.guess_type(file_name)[0] or "application/octet-stream").encode("latin-1")
+        scope = dict(scope, path=scope["path"] + suffix, raw_path=scope.get("raw_path", b"") + suffix.encode())
+
+        async def send_encoded(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = [
+                    (k, v) for k, v in message.get("headers", [])
+                    if k.lower() not in (b"content-type", b"content-encoding", b"vary", b"accept-ranges")
+                ]
+                headers += [
+                    (b"content-type", content_type),
+                    (b"content-encoding", encoding.encode()),
+                    (b"vary", b"Accept-Encoding"),
+                ]
+                message = dict(message, headers=headers)
+            await send(message)
+
+        await self.app(scope, receive, send_encoded)
+
+# -----------------------------
+# Startup — publish assets, then warm the caches in the background
+# -----------------------------
+warmup = {"ready": False, "error": "", "seconds": {}}
+
+def warm_caches():
+    start = time.perf_counter()
+    try:
+        import components  # the app's own modules, as main.py would import them
+
+        warmup["seconds"]["import"] = time.perf_counter() - start
+        warmup["seconds"].update(components.prewarm())
+    except Exception as e:
+        # Still ready: the app works, the first visitor just fills the caches
+        logger.exception("cache warm-up failed")
+        warmup["error"] = str(e)
+    warmup["seconds"]["total"] = time.perf_counter() - start
+    warmup["ready"] = True
+    logger.info("caches warm in %.0f ms", warmup["seconds"]["total"] * 1000)
+
+# Publish every asset (and its compressed variants) before the first request
+@asynccontextmanager
+async def publish_assets(app):
+    try:
+        await asyncio.to_thread(assets.build_manifest)
+    except Exception:
+        logger.exception("could not publish static assets; they will be built on first use")
+    threading.Thread(target=warm_caches, name="cache-warmup", daemon=True).start()
+    yield
+
+async def ready(request):
+    body = {"ready": warmup["ready"], "error": warmup["error"],
+            "ms": {step: round(s * 1000, 1) for step, s in warmup["seconds"].items()}}
+    return JSONResponse(body, status_code=200 if warmup["ready"] else 503)
+
+if not config.is_manually_set("server.fileWatcherType"):
+    config.set_option("server.fileWatcherType", "none", where_defined=__file__)
+
+app = st.App(
+    "main.py",
+    lifespan=publish_assets,
+    routes=[Route("/ready", ready)],
+    middleware=[Middleware(StaticCacheHeaders), Middleware(PrecompressedStatic), Middleware(ClientHints)],
+)
@@ -0,0 +1,267 @@
+"""Static assets for the portfolio: the CSS bundle, image variants and the resume.
+
+main.py caches these builds per file version, and export.py reuses them
+to write the static site.
+
+Every published file carries a content hash in its name, so it can be cached
+forever (see asgi.py). Running this module at build time publishes everything
+up front and records the names in static/manifest.json; the app then looks
+files up there instead of re-encoding images on first use:
+
+    python assets.py
+
+The CSS bundle also gets precompressed .gz (and, with the optional brotli
+package, .br) siblings; asgi.py picks one per request from Accept-Encoding.
+The resume does not: a PDF viewer only switches to byte-range requests
+when the first response is uncompressed and says "Accept-Ranges: bytes",
+and the PDF barely compresses anyway.
+"""
+import os
+import io
+import re
+import gzip
+import json
+import uuid
+import hashlib
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip variants are written
+    brotli = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Served at app/static/ by Streamlit (see .streamlit/config.toml)
+STATIC_DIR = os.path.join(ROOT_DIR, "static")
+
+# Widths we generate image variants for (never larger than the source)
+IMAGE_WIDTHS = (160, 320, 640)
+
+MANIFEST = os.path.join(STATIC_DIR, "manifest.json")
+
+# Source files published by build_manifest(), relative to ROOT_DIR
+STYLESHEET = "styles.css"
+IMAGES = ("mujakkir_profile.png", "profile.png")
+RESUME = "resume.pdf"
+
+# -----------------------------
+# Styles
+# -----------------------------
+BASE_CSS = """
+    :root {
+        --brand: #f5b00f;
+        --text: #1841a1;
+        --muted: #475569;
+        --bg: #519673;
+    }
+    html, body { background: var(--bg); }
+    h1,h2,h3,h4 { color: var(--brand) !important; font-weight: 700; }
+    .subtitle { color: var(--muted); margin-top: -8px; margin-bottom: 8px; }
+    .stContainer { border-radius: 16px; border: 1px solid #e2e8f0; }
+    .stButton>button, .stLinkButton>button, .stDownloadButton>button {
+        background: var(--brand) !important;
+        color: #fff !important;
+        border-radius: 12px !important;
+        padding: 8px 14px !important;
+        border: none !important;
+    }
+    [data-testid="stMetricValue"] { color: var(--brand) !important; }
+    [data-testid="stMetricLabel"] { color: var(--muted) !important; }
+    .social-icon { font-size: 1.5rem; margin-right: 10px; }
+    .link-status { float: right; font-size: 0.85em; }
+    .media-placeholder { background: #e2e8f0; border-radius: 12px; margin-bottom: 16px; }
+    .media-placeholder.image { aspect-ratio: 1; }
+    .media-placeholder.resume { height: 648px; }
+"""
+
+SIDEBAR_CSS = """
+    .sidebar-card { background-color: #0fa8f5; padding: 15px; border-radius: 10px; }
+    .sidebar-card.spaced { margin-bottom: 20px; }
+    .sidebar-card h3, .sidebar-card h4 { margin-top: 0; color: #4b0082; }
+    .sidebar-card p { margin-bottom: 8px; }
+    .sidebar-card .icon { font-size: 18px; margin-right: 8px; }
+    .sidebar-card a { color: #4b0082; text-decoration: none; }
+    .social-links { display: flex; justify-content: space-between; }
+    .social-links a { font-size: 24px; margin-right: 15px; }
+    .social-links a:last-child { margin-right: 0; }
+    .social-links span { font-size: 28px; }
+"""
+
+FOOTER_CSS = """
+    .footer {
+        position: fixed;
+        left: 0;
+        bottom: 0;
+        width: 100%;
+        background-color: #0fa8f5;
+        color: #e4e4ed;
+        text-align: center;
+        padding: 10px 0;
+        font-size: 16px;
+        box-shadow: 0 -1px 5px rgba(0,0,0,0.1);
+    }
+"""
+
+# Pre-rendered content items (see markup.py), in the app and in the static export
+CARD_CSS = """
+    .card { border: 1px solid #e2e8f0; border-radius: 16px; padding: 16px; }
+    .testimonial { height: 200px; overflow: auto; }
+    .caption { color: #808495; font-size: 14px; }
+    a.button { display: block; text-align: center; background: var(--brand); color: #fff !important;
+        border-radius: 12px; padding: 8px 14px; text-decoration: none; margin-top: 8px; }
+"""
+
+BUILTIN_CSS = (BASE_CSS, SIDEBAR_CSS, FOOTER_CSS, CARD_CSS)
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+# -----------------------------
+# Publishing
+# -----------------------------
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:16]
+
+# Write a generated file once; names carry a content hash so they never go stale
+def publish_static(file_name, data, static_dir=STATIC_DIR):
+    static_path = os.path.join(static_dir, file_name)
+    if not os.path.exists(static_path):
+        os.makedirs(static_dir, exist_ok=True)
+        tmp_path = f"{static_path}.{uuid.uuid4().hex}.tmp"  # unique per writer
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, static_path)
+    return static_path
+
+# Content-Encoding -> file suffix of the precompressed sibling, best first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+# Published files that get (and may be served as) precompressed siblings
+PRECOMPRESSED_SUFFIXES = (".css",)
+
+def _compress(encoding, data):
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+# Write .br/.gz siblings of a published file (skipping any that would not be smaller)
+def precompress(static_path):
+    with open(static_path, "rb") as f:
+        data = f.read()
+    static_dir, file_name = os.path.split(static_path)
+    written = []
+    for encoding, suffix in ENCODINGS:
+        if encoding == "br" and brotli is None:
+            continue
+        if not os.path.exists(static_path + suffix):
+            packed = _compress(encoding, data)
+            if len(packed) >= len(data):
+                continue
+            publish_static(file_name + suffix, packed, static_dir)
+        written.append(encoding)
+    return written
+
+# Merge the built-in styles with an optional stylesheet; returns the bundle's file name
+def build_css_bundle(file_path, static_dir=STATIC_DIR, extra_css=""):
+    parts = [*BUILTIN_CSS, extra_css]
+    if os.path.exists(file_path):
+        with open(file_path, "r") as f:
+            parts.append(f.read())
+    css = minify_css("\n".join(parts)).encode("utf-8")
+    file_name = f"styles.{content_hash(css)}.css"
+    precompress(publish_static(file_name, css, static_dir))
+    return file_name
+
+# Resize and re-encode an image; returns {width: file name}.
+# Pillow is imported here: when the manifest is current it is never needed
+def build_image_variants(image_path, static_dir=STATIC_DIR):
+    from PIL import Image, features
+
+    with open(image_path, "rb") as f:
+        data = f.read()
+    digest = content_hash(data)
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    fmt, ext = ("WEBP", "webp") if features.check("webp") else ("PNG", "png")
+    variants = {}
+    with Image.open(io.BytesIO(data)) as img:
+        for w in sorted({min(w, img.width) for w in IMAGE_WIDTHS}):
+            file_name = f"{stem}.{digest}.w{w}.{ext}"
+            if not os.path.exists(os.path.join(static_dir, file_name)):
+                resized = img.resize((w, round(img.height * w / img.width)), Image.LANCZOS)
+                buf = io.BytesIO()
+                resized.save(buf, fmt, quality=85, method=6, optimize=True)
+                publish_static(file_name, buf.getvalue(), static_dir)
+            variants[w] = file_name
+    return variants
+
+# Smallest variant that still covers the requested width
+def pick_variant(variants, width):
+    return variants[min((w for w in variants if w >= width), default=max(variants))]
+
+# Publish a content-hashed copy of the resume; returns (bytes, file name)
+def publish_resume(pdf_path, static_dir=STATIC_DIR):
+    with open(pdf_path, "rb") as f:
+        data = f.read()
+    file_name = f"resume.{content_hash(data)}.pdf"
+    publish_static(file_name, data, static_dir)
+    return data, file_name
+
+# -----------------------------
+# Manifest — source file -> published names, written at build time
+# -----------------------------
+# Identifies one version of a source file (None if it does not exist)
+def file_stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+# The stylesheet's stamp also covers the built-in styles, so changing them rebuilds the bundle
+def css_stamp(path):
+    return [file_stamp(path), content_hash("".join(BUILTIN_CSS).encode("utf-8"))]
+
+def build_manifest(root_dir=ROOT_DIR, static_dir=STATIC_DIR):
+    css_path = os.path.join(root_dir, STYLESHEET)
+    manifest = {STYLESHEET: {"stamp": css_stamp(css_path), "file": build_css_bundle(css_path, static_dir)}}
+    for name in IMAGES:
+        path = os.path.join(root_dir, name)
+        if os.path.exists(path):
+            variants = build_image_variants(path, static_dir)
+            manifest[name] = {"stamp": file_stamp(path), "variants": {str(w): f for w, f in variants.items()}}
+    resume_path = os.path.join(root_dir, RESUME)
+    if os.path.exists(resume_path):
+        manifest[RESUME] = {"stamp": file_stamp(resume_path), "file": publish_resume(resume_path, static_dir)[1]}
+
+    manifest_path = os.path.join(static_dir, os.path.basename(MANIFEST))
+    tmp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
+def read_manifest(manifest_path=MANIFEST):
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+# The manifest entry for a source file, or None if the file changed since the build
+def manifest_entry(path, manifest=None, static_dir=STATIC_DIR):
+    manifest = read_manifest() if manifest is None else manifest
+    entry = manifest.get(os.path.basename(path))
+    stamp = css_stamp(path) if os.path.basename(path) == STYLESHEET else file_stamp(path)
+    if not entry or entry.get("stamp") != stamp:
+        return None
+    names = entry["variants"].values() if "variants" in entry else [entry["file"]]
+    if not all(os.path.exists(os.path.join(static_dir, name)) for name in names):
+        return None
+    return entry
+
+if __name__ == "__main__":
+    for source, entry in build_manifest().items():
+        print(f"{source}: {entry.get('variants') or entry['file']}")
@@ -0,0 +1,110 @@
+"""Cold start: what the first visitor of a fresh server process waits for.
+
+Starts `streamlit run asgi.py`, waits for /_stcore/health (and, with
+--wait-ready, for /ready), then opens one session and times its first
+run: to the first delta (first paint), to the Home title (first text:
+the sidebar comes before it, but it is the first thing a visitor reads)
+and to script_finished. A second session is timed the same way, as the
+warm reference. Repeats --runs times, with a new server each time, and
+reports medians.
+
+    python benchmarks/cold_start.py
+    python benchmarks/cold_start.py --wait-ready   # only connect once caches are hot
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import tempfile
+import urllib.error
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from resume_delivery import ROOT_DIR, free_port, start_server  # noqa: E402
+
+with open(os.path.join(ROOT_DIR, "content.json"), encoding="utf-8") as f:
+    HOME_TITLE = f"# {json.load(f)['Home']['title']}"
+
+def wait_ready(port, timeout=120):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=2):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.1)
+    raise RuntimeError("server never reported ready")
+
+# Seconds from the rerun request to the first delta, the Home title and script_finished
+async def first_run(port):
+    async with websockets.connect(f"ws://127.0.0.1:{port}/_stcore/stream",
+                                  subprotocols=["streamlit"], max_size=None) as ws:
+        back = BackMsg()
+        back.rerun_script.query_string = ""
+        start = time.perf_counter()
+        await ws.send(back.SerializeToString())
+        first_delta = first_text = None
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await ws.recv())
+            kind = msg.WhichOneof("type")
+            if kind == "delta" and first_delta is None:
+                first_delta = time.perf_counter() - start
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                if element.WhichOneof("type") == "exception":
+                    raise RuntimeError(element.exception.message)
+                if first_text is None and element.WhichOneof("type") == "markdown" \
+                        and element.markdown.body == HOME_TITLE:
+                    first_text = time.perf_counter() - start
+            if kind == "script_finished":
+                return first_delta, first_text, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the first visitor of a fresh server.")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--wait-ready", action="store_true", help="wait for /ready before connecting")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="portfolio-cold-")
+    os.environ["CONTACT_OUTBOX_DB"] = os.path.join(scratch, "outbox.db")
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch, "analytics.db")
+
+    rows = {"boot": [], "ready": [], "cold_paint": [], "cold_text": [], "cold_run": [],
+            "warm_paint": [], "warm_text": [], "warm_run": []}
+    for _ in range(args.runs):
+        port = free_port()
+        start = time.perf_counter()
+        proc = start_server(port)
+        try:
+            rows["boot"].append(time.perf_counter() - start)
+            if args.wait_ready:
+                wait_ready(port)
+                rows["ready"].append(time.perf_counter() - start)
+            for visitor in ("cold", "warm"):
+                paint, text, run = asyncio.run(first_run(port))
+                rows[f"{visitor}_paint"].append(paint)
+                rows[f"{visitor}_text"].append(text)
+                rows[f"{visitor}_run"].append(run)
+        finally:
+            proc.terminate()
+            proc.wait(10)
+
+    for name, label in [("boot", "healthy after"), ("ready", "ready after"),
+                        ("cold_paint", "first visitor: first paint"), ("cold_text", "first visitor: first text"),
+                        ("cold_run", "first visitor: full run"),
+                        ("warm_paint", "warm visitor: first paint"), ("warm_text", "warm visitor: first text"),
+                        ("warm_run", "warm visitor: full run")]:
+        if rows[name]:
+            print(f"{label:30s} {statistics.median(rows[name]) * 1000:>9,.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""A bot flooding the contact form, driven through AppTest: does the limiter hold?
+
+One visitor session submits --submits distinct messages as fast as the
+form reruns; a second session then resubmits the first message word for
+word. A third session submits a message while the outbox table is
+missing, then resubmits it once the table is back. Each submission reruns
+only the form fragment, as in the browser. Expected, with the default
+limits:
+
+- the first session_burst messages are accepted (plus one per refill
+  interval that passes during the run), every other one is throttled;
+- the resubmission is deduplicated;
+- the message sent during the outage shows an error, and its resubmission
+  is accepted, not deduplicated;
+- the outbox holds exactly the accepted messages, and balloons were only
+  sent for those;
+- the contact_submissions counters in metrics.py match the verdicts the
+  page showed.
+
+Exits with status 1 on any mismatch.
+
+    python benchmarks/contact_flood.py
+    python benchmarks/contact_flood.py --submits 5000
+"""
+import os
+import re
+import sys
+import time
+import sqlite3
+import argparse
+import tempfile
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from rerun import ROOT_DIR, fragment_of, last_deltas, new_app, timed_run  # noqa: E402
+
+sys.path.insert(0, ROOT_DIR)
+import metrics  # noqa: E402
+import ratelimit  # noqa: E402
+
+COUNTER_RE = re.compile(r'^portfolio_contact_submissions_total\{verdict="(\w+)"\} (\d+)', re.MULTILINE)
+
+# Fills the form and reruns its fragment; returns the verdict the page shows
+def submit(at, message):
+    at.text_input(key="contact_name").input("Flood")
+    at.text_input(key="contact_email").input("flood@example.com")
+    at.text_area(key="contact_message").input(message)
+    button = at.button[0]
+    button.click()
+    timed_run(at, fragment_of(button))
+    balloons = any(m.delta.WhichOneof("type") == "new_element"
+                   and m.delta.new_element.WhichOneof("type") == "balloons" for m in last_deltas())
+    if at.success:
+        return ratelimit.ACCEPTED, balloons
+    if at.warning:
+        return ratelimit.THROTTLED, balloons
+    if at.info:
+        return ratelimit.DUPLICATE, balloons
+    return "error", balloons
+
+def main():
+    parser = argparse.ArgumentParser(description="Flood the contact form through AppTest.")
+    parser.add_argument("--submits", type=int, default=2000, help="submissions from one session (default: 2000)")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    os.environ["CONTACT_OUTBOX_DB"] = os.path.join(scratch, "outbox.db")
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch, "analytics.db")
+    os.environ.pop("CONTACT_SMTP_HOST", None)
+    os.environ.pop("PORTFOLIO_STATE_DB", None)
+    os.environ["PORTFOLIO_LINK_CHECKS"] = "0"
+    os.chdir(ROOT_DIR)
+
+    start = time.perf_counter()
+    bot = new_app("Contact")
+    bot.run()
+    seen, balloons = Counter(), 0
+    for i in range(args.submits):
+        verdict, shown = submit(bot, f"Flood message {i}")
+        seen[verdict] += 1
+        balloons += shown
+    again = new_app("Contact")
+    again.run()
+    verdict, shown = submit(again, "Flood message 0")
+    seen[verdict] += 1
+    balloons += shown
+    outage = new_app("Contact")
+    outage.run()
+    with sqlite3.connect(os.environ["CONTACT_OUTBOX_DB"]) as conn:
+        conn.execute("ALTER TABLE outbox RENAME TO outbox_away")
+    lost, _ = submit(outage, "Sent during an outage")
+    with sqlite3.connect(os.environ["CONTACT_OUTBOX_DB"]) as conn:
+        conn.execute("ALTER TABLE outbox_away RENAME TO outbox")
+    resent, shown = submit(outage, "Sent during an outage")
+    seen[lost] += 1
+    seen[resent] += 1
+    balloons += shown
+    elapsed = time.perf_counter() - start
+
+    rate, burst = ratelimit.ContactGuard().session_limit
+    most_accepted = burst + int(elapsed * rate) + 2  # + the resent message
+    with sqlite3.connect(os.environ["CONTACT_OUTBOX_DB"]) as conn:
+        stored = conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+    counted = {verdict: int(n) for verdict, n in COUNTER_RE.findall(metrics.render_prometheus())}
+
+    total = args.submits + 3
+    print(f"{total:,} submissions in {elapsed:.1f} s ({elapsed / total * 1000:.1f} ms each)")
+    print("  " + ", ".join(f"{seen[v]:,} {v}" for v in (*ratelimit.VERDICTS, "error")))
+    print(f"  {stored} in the outbox, {balloons} balloons, counters {counted}")
+
+    failures = []
+    if not burst + 1 <= seen[ratelimit.ACCEPTED] <= most_accepted:
+        failures.append(f"{seen[ratelimit.ACCEPTED]} accepted; expected {burst + 1} to {most_accepted}")
+    if seen[ratelimit.DUPLICATE] != 1 or verdict != ratelimit.DUPLICATE:
+        failures.append(f"resubmission was {verdict}, {seen[ratelimit.DUPLICATE]} deduplicated in all")
+    if (lost, resent) != ("error", ratelimit.ACCEPTED) or seen["error"] != 1:
+        failures.append(f"during the outage {lost}, then {resent}; {seen['error']} errors in all")
+    if stored != seen[ratelimit.ACCEPTED] or balloons != seen[ratelimit.ACCEPTED]:
+        failures.append(f"{stored} stored and {balloons} balloons for {seen[ratelimit.ACCEPTED]} accepted")
+    if counted != {v: n for v, n in seen.items() if n}:
+        failures.append(f"metrics counted {counted}, the page showed {dict(seen)}")
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Backtest times of the Expense Forecasting demo on the Projects page.
+
+Runs forecast.py on the bundled series (--series of them, first --months
+months), through a fresh Forecaster each time except where noted:
+
+- full: every config backtested from the first month, in process;
+- pool: the same through --workers processes (skipped when 1), counting
+  the pool's start-up, then once more with the pool warm;
+- cached: the same series again, answered from the memo;
+- append: one more month, each backtest advanced from its cached prefix,
+  against refitting that longer series from scratch.
+
+Each appended result must match the refit one: the same errors and the
+same forecast. Exits with status 1 if any differs, or if the append is
+not faster than the refit.
+
+    python benchmarks/forecast.py
+    python benchmarks/forecast.py --series 300 --months 48 --workers 4
+"""
+import os
+import sys
+import time
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+import forecast  # noqa: E402
+
+def timed(forecaster, series):
+    start = time.perf_counter()
+    results = forecaster.backtest(series)
+    return time.perf_counter() - start, results
+
+def same(a, b):
+    return (a.scored == b.scored and a.forecast() == b.forecast()
+            and all(abs(x - y) <= 1e-9 * max(1.0, abs(y)) for x, y in zip(a.abs_err + a.pct_err, b.abs_err + b.pct_err)))
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure backtest times of the forecasting demo.")
+    parser.add_argument("--series", type=int, default=300, help="series to backtest (default: all 300)")
+    parser.add_argument("--months", type=int, default=48, help="months before the append (default: 48)")
+    parser.add_argument("--workers", type=int, default=forecast.DEFAULT_WORKERS,
+                        help=f"pool processes (default: {forecast.DEFAULT_WORKERS})")
+    args = parser.parse_args()
+    _, data = forecast.expense_series()
+    series, longer = data[:args.series, :args.months], data[:args.series, :args.months + 1]
+    backtests = len(series) * len(forecast.CONFIGS)
+    print(f"{len(series)} series x {len(forecast.CONFIGS)} configs = {backtests:,} backtests"
+          f" over {args.months} months")
+
+    forecaster = forecast.Forecaster(workers=1)
+    full_s, _ = timed(forecaster, series)
+    print(f"{'full, in process':24s} {full_s * 1000:8,.0f} ms")
+
+    if args.workers > 1:
+        pool = forecast.Forecaster(workers=args.workers)
+        try:
+            cold_s, _ = timed(pool, series)
+            pool._cache.clear()
+            warm_s, _ = timed(pool, series)
+        finally:
+            pool.shutdown()
+        print(f"{f'full, {args.workers} workers':24s} {cold_s * 1000:8,.0f} ms with start-up,"
+              f" {warm_s * 1000:,.0f} ms warm")
+
+    cached_s, _ = timed(forecaster, series)
+    print(f"{'cached':24s} {cached_s * 1000:8,.0f} ms   ({forecaster.hits:,} hits)")
+
+    append_s, appended = timed(forecaster, longer)
+    refit_s, refit = timed(forecast.Forecaster(workers=1), longer)
+    print(f"{'append one month':24s} {append_s * 1000:8,.0f} ms   ({forecaster.extended:,} extended)")
+    print(f"{'refit one month longer':24s} {refit_s * 1000:8,.0f} ms   ({refit_s / append_s:.1f}x the append)")
+
+    failures = []
+    mismatched = [(i, c) for i, (a, b) in enumerate(zip(appended, refit)) for c in a if not same(a[c], b[c])]
+    if mismatched:
+        failures.append(f"{len(mismatched)} appended backtests differ from a refit, e.g. {mismatched[:3]}")
+    if append_s >= refit_s:
+        failures.append(f"append {append_s * 1000:,.0f} ms is not faster than refit {refit_s * 1000:,.0f} ms")
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""Link badges against a local stub HTTP server: probes, non-blocking reads, refreshes.
+
+Starts an http.server stub with an app page, a 503 and a slow page, plus a
+port with nothing listening, then checks linkcheck.py:
+
+- probe() reads the title and og:image of a 200 page, and reports the 503
+  and the refused connection as down;
+- LinkMonitor.get() on the slow page returns None at once, keeps returning
+  None without waiting while the one probe is in flight, then returns the
+  status once it lands;
+- after the TTL, get() returns the stale status at once and a refresh
+  follows; the scheduler started by start() re-probes on its own too.
+
+Exits with status 1 if any check fails.
+
+    python benchmarks/link_monitor.py
+    python benchmarks/link_monitor.py --slow 3 --ttl 2
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+import linkcheck  # noqa: E402
+
+APP_PAGE = b"""<!doctype html><html><head>
+<title>Sales &amp; Deposit Dashboard</title>
+<meta property="og:image" content="https://example.com/thumb.png">
+</head><body>app</body></html>"""
+
+# /app: 200 with a preview, /down: 503, /slow: 200 after server.delay seconds
+class Stub(BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.hits[self.path] += 1
+        if self.path == "/down":
+            self.send_error(503)
+            return
+        if self.path == "/slow":
+            time.sleep(self.server.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(APP_PAGE)))
+        self.end_headers()
+        self.wfile.write(APP_PAGE)
+
+    def log_message(self, *args):
+        pass
+
+def start_stub(delay):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.hits = Counter()
+    server.delay = delay
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def refused_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{s.getsockname()[1]}/"
+
+# Polls until fn() returns something truthy; None after timeout seconds
+def wait_for(fn, timeout):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        result = fn()
+        if result:
+            return result
+        time.sleep(0.02)
+    return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Check linkcheck.py against a local stub server.")
+    parser.add_argument("--slow", type=float, default=2.0, help="seconds the slow page takes (default: 2)")
+    parser.add_argument("--ttl", type=float, default=1.0, help="LinkMonitor TTL in seconds (default: 1)")
+    args = parser.parse_args()
+
+    server = start_stub(args.slow)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    failures = []
+
+    app = linkcheck.probe(f"{base}/app")
+    down = linkcheck.probe(f"{base}/down")
+    refused = linkcheck.probe(refused_url(), timeout=2.0)
+    for name, status in (("200", app), ("503", down), ("refused", refused)):
+        print(f"{'probe ' + name:22s} ok={status.ok} status={status.status_code} {status.elapsed_ms:6.1f} ms"
+              f" title={status.title!r} thumbnail={status.thumbnail!r}")
+    if (app.ok, app.status_code, app.title, app.thumbnail) != (
+            True, 200, "Sales & Deposit Dashboard", "https://example.com/thumb.png"):
+        failures.append(f"200 page probed as {app}")
+    if down.ok or down.status_code != 503:
+        failures.append(f"503 page probed as {down}")
+    if refused.ok or refused.status_code != 0 or not refused.error:
+        failures.append(f"refused connection probed as {refused}")
+
+    monitor = linkcheck.LinkMonitor(ttl=args.ttl, timeout=args.slow + 5)
+    slow = f"{base}/slow"
+    reads, first = [], None
+    start = time.perf_counter()
+    while first is None and time.perf_counter() - start < args.slow + 5:
+        before = time.perf_counter()
+        first = monitor.get(slow)
+        reads.append(time.perf_counter() - before)
+        time.sleep(0.05)
+    landed = time.perf_counter() - start
+    print(f"{'get() on slow page':22s} {len(reads)} reads, slowest {max(reads) * 1000:.1f} ms,"
+          f" status after {landed:.1f} s, {server.hits['/slow']} probe(s)")
+    if max(reads) > 0.05:
+        failures.append(f"get() waited {max(reads) * 1000:.0f} ms on a {args.slow:g} s page")
+    if first is None or not first.ok or landed < args.slow * 0.9:
+        failures.append(f"slow page status {first} after {landed:.1f} s")
+    if server.hits["/slow"] != 1:
+        failures.append(f"slow page probed {server.hits['/slow']} times while one probe was in flight")
+
+    url = f"{base}/app"
+    fresh = wait_for(lambda: monitor.get(url), 5)
+    time.sleep(args.ttl + 0.1)
+    before = time.perf_counter()
+    stale = monitor.get(url)
+    stale_s = time.perf_counter() - before
+    refreshed = wait_for(lambda: (s := monitor.get(url)) and s.checked_at > fresh.checked_at and s, 5)
+    print(f"{'get() after the TTL':22s} stale status in {stale_s * 1000:.1f} ms,"
+          f" refreshed: {refreshed is not None}, {server.hits['/app'] - 1} probe(s)")
+    if stale != fresh or stale_s > 0.05:
+        failures.append(f"after the TTL get() returned {stale} in {stale_s * 1000:.0f} ms, not the stale status")
+    if refreshed is None:
+        failures.append("no refresh after the TTL")
+
+    probed = server.hits["/app"]
+    monitor.start()
+    rescheduled = wait_for(lambda: server.hits["/app"] > probed, args.ttl * 3)
+    print(f"{'scheduler':22s} re-probed without a get(): {bool(rescheduled)}")
+    if not rescheduled:
+        failures.append(f"scheduler did not re-probe within {args.ttl * 3:g} s")
+
+    monitor.stop()
+    server.shutdown()
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
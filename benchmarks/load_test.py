@@ -0,0 +1,306 @@
+"""Concurrent-session load test: how many visitors one server process can take.
+
+Starts `streamlit run asgi.py` locally, then for each concurrency level N
+opens N websocket sessions at once and drives each through a navigation
+script the way a browser would: the first run, sidebar page changes, a
+resume download (a GET of the button's media URL, then the button's
+rerun) and a contact form submission (a fragment rerun).
+Sessions pause --think-ms (jittered) between steps.
+
+A rerun is timed from sending the BackMsg to receiving script_finished.
+For every level it reports p50/p95/p99 rerun latency, reruns per second,
+the p95 time to fetch the resume, the server's RSS growth per open
+session (from /proc, so Linux only) and the error rate (exceptions
+rendered by the app, failed downloads, dropped connections, timeouts).
+The knee is the first level whose p95 exceeds --knee-factor times the
+p95 of the lowest level.
+
+All sessions come from 127.0.0.1, so after the first few submissions the
+contact form's per-IP limit answers "You're sending messages too
+quickly"; that is a verdict shown in the form, not an error.
+
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --levels 1,10,25,50,100 --think-ms 500 --json load.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+import tempfile
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from resume_delivery import free_port, start_server  # noqa: E402
+
+# Each session follows one of these; "download" (Home) and "submit" (Contact) act on the current page
+SCRIPTS = [
+    ("Home", "download", "Projects", "Experience", "Contact", "submit"),
+    ("Home", "Projects", "Services", "Testimonials", "Contact", "submit"),
+    ("Home", "Skills", "Education", "Experience", "Home", "download"),
+    ("Home", "Projects", "Contact", "submit", "Home", "download"),
+]
+
+RERUN_TIMEOUT = 60.0
+
+def rss_kb(pid):
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+def percentile(values, q):
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+class Session:
+    """One browser tab: keeps the widgets the server rendered and sends their state back."""
+
+    def __init__(self, base_url, ws):
+        self.base_url = base_url
+        self.ws = ws
+        self.session_id = ""
+        self.widgets = {}  # widget id -> (element type, element proto, fragment id)
+        self.values = {}  # widget id -> (value field, value) as the browser would hold it
+        self.errors = []
+        self._pending = {}  # backend request id -> future
+
+    def _collect(self, msg):
+        kind = msg.WhichOneof("type")
+        if kind == "new_session":
+            self.session_id = msg.new_session.initialize.session_id
+        elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+            element = msg.delta.new_element
+            element_type = element.WhichOneof("type")
+            if element_type == "exception":
+                self.errors.append(f"app exception: {element.exception.message}")
+                return
+            proto = getattr(element, element_type)
+            widget_id = getattr(proto, "id", "")
+            if widget_id:
+                self.widgets[widget_id] = (element_type, proto, msg.delta.fragment_id)
+        elif kind == "backend_operation_response":
+            future = self._pending.pop(msg.backend_operation_response.request_id, None)
+            if future is not None and not future.done():
+                future.set_result(msg.backend_operation_response)
+
+    async def _receive_until_finished(self):
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.ws.recv())
+            self._collect(msg)
+            if msg.WhichOneof("type") == "script_finished":
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return
+
+    def find(self, element_type, predicate):
+        for widget_id, (kind, proto, fragment_id) in self.widgets.items():
+            if kind == element_type and predicate(widget_id, proto):
+                return widget_id, proto, fragment_id
+        raise LookupError(f"no {element_type} widget on the page")
+
+    # Sends the current widget values (plus an optional trigger) and waits for the run to finish
+    async def rerun(self, trigger=None, fragment_id=""):
+        back = BackMsg()
+        state = back.rerun_script
+        state.query_string = ""
+        state.fragment_id = fragment_id
+        for widget_id, (field, value) in self.values.items():
+            widget = state.widget_states.widgets.add()
+            widget.id = widget_id
+            setattr(widget, field, value)
+        if trigger:
+            widget = state.widget_states.widgets.add()
+            widget.id = trigger
+            widget.trigger_value = True
+        if not fragment_id:
+            self.widgets = {}  # a full run redraws the page; only what it renders is clickable
+        start = time.perf_counter()
+        await self.ws.send(back.SerializeToString())
+        await asyncio.wait_for(self._receive_until_finished(), RERUN_TIMEOUT)
+        return time.perf_counter() - start
+
+    async def navigate(self, page):
+        radio_id = self.find("radio", lambda widget_id, _: widget_id.endswith("nav_page"))[0]
+        self.values[radio_id] = ("string_value", page)
+        return await self.rerun()
+
+    # The browser fetches the file first, then reruns for the button's on_click
+    async def download(self):
+        button_id, proto, fragment_id = self.find("download_button", lambda *_: True)
+        start = time.perf_counter()
+        url = proto.url
+        if proto.deferred_file_id:
+            # A deferred download: the server produces the file and returns its URL
+            response = await self._request_deferred_file(proto.deferred_file_id)
+            if response.error_msg:
+                self.errors.append(f"download: {response.error_msg}")
+                url = ""
+            else:
+                url = response.deferred_file.url
+        if url:
+            body = await asyncio.to_thread(lambda: urllib.request.urlopen(self.base_url + url, timeout=30).read())
+            if not body.startswith(b"%PDF"):
+                self.errors.append("download: response is not a PDF")
+        fetched = time.perf_counter() - start
+        return fetched, await self.rerun(trigger=button_id, fragment_id=fragment_id)
+
+    async def _request_deferred_file(self, file_id):
+        back = BackMsg()
+        request = back.backend_operation_request
+        request.request_id = f"{self.session_id}-{time.perf_counter_ns()}"
+        request.session_id = self.session_id
+        request.deferred_file.file_id = file_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request.request_id] = future
+        await self.ws.send(back.SerializeToString())
+        # The response arrives on the same socket; read until it shows up
+        while not future.done():
+            msg = ForwardMsg()
+            msg.ParseFromString(await asyncio.wait_for(self.ws.recv(), RERUN_TIMEOUT))
+            self._collect(msg)
+        return future.result()
+
+    async def submit_contact(self, n):
+        def field(label):
+            return lambda _, proto: proto.label == label
+
+        fields = {
+            "Your Name*": f"Load Test {n}",
+            "Your Email*": f"load{n}@example.com",
+            "Subject": "Capacity test",
+            "Message*": f"Message {n} from the load test.",
+        }
+        for label, value in fields.items():
+            element_type = "text_area" if label == "Message*" else "text_input"
+            widget_id = self.find(element_type, field(label))[0]
+            self.values[widget_id] = ("string_value", value)
+        submit_id, _, fragment_id = self.find("button", lambda _, proto: proto.is_form_submitter)
+        elapsed = await self.rerun(trigger=submit_id, fragment_id=fragment_id)
+        # clear_on_submit: the browser resets the fields after a submission
+        for label in fields:
+            self.values.pop(self.find("text_area" if label == "Message*" else "text_input", field(label))[0], None)
+        return elapsed
+
+async def run_session(n, ws_url, base_url, think, rng, results):
+    script = SCRIPTS[n % len(SCRIPTS)]
+    try:
+        async with websockets.connect(ws_url, subprotocols=["streamlit"], max_size=None) as ws:
+            session = Session(base_url, ws)
+            for step in script:
+                if step == "Home" and not session.widgets:
+                    elapsed = await session.rerun()
+                elif step == "download":
+                    fetched, elapsed = await session.download()
+                    results["downloads"].append(fetched)
+                elif step == "submit":
+                    elapsed = await session.submit_contact(n)
+                else:
+                    elapsed = await session.navigate(step)
+                results["latencies"].append(elapsed)
+                await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+            results["errors"] += len(session.errors)
+            results["error_samples"] += session.errors[:1]
+            results["steps"] += len(script)
+            # Stay connected until every session is done, so RSS is measured with all of them open
+            results["done"] += 1
+            await results["all_done"].wait()
+    except Exception as e:
+        results["errors"] += 1
+        results["steps"] += 1
+        results["error_samples"].append(f"{type(e).__name__}: {e}")
+        results["done"] += 1
+
+async def run_level(n, port, pid, think, seed):
+    ws_url = f"ws://127.0.0.1:{port}/_stcore/stream"
+    base_url = f"http://127.0.0.1:{port}"
+    results = {"latencies": [], "downloads": [], "errors": 0, "steps": 0, "done": 0, "error_samples": [],
+               "all_done": asyncio.Event()}
+    rss_before = rss_kb(pid)
+    start = time.perf_counter()
+    tasks = [
+        asyncio.create_task(run_session(i, ws_url, base_url, think, random.Random(seed + i), results))
+        for i in range(n)
+    ]
+    while results["done"] < n:
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    rss_open = rss_kb(pid)
+    results["all_done"].set()
+    await asyncio.gather(*tasks)
+    latencies = [t * 1000 for t in results["latencies"]]
+    return {
+        "sessions": n,
+        "reruns": len(latencies),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "mean_ms": statistics.fmean(latencies) if latencies else float("nan"),
+        "reruns_per_s": len(latencies) / elapsed,
+        "download_p95_ms": percentile([t * 1000 for t in results["downloads"]], 95),
+        "rss_mb": rss_open / 1024,
+        "rss_kb_per_session": (rss_open - rss_before) / n,
+        "error_rate": results["errors"] / max(results["steps"], 1),
+        "error_samples": results["error_samples"][:3],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent websocket sessions against a local server.")
+    parser.add_argument("--levels", default="1,5,10,25,50", help="comma-separated session counts")
+    parser.add_argument("--think-ms", type=float, default=250.0, help="mean pause between steps (default: 250)")
+    parser.add_argument("--knee-factor", type=float, default=2.0,
+                        help="knee = first level whose p95 exceeds this multiple of the lowest level's")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+    levels = [int(n) for n in args.levels.split(",")]
+
+    # Keep the load test's messages and events out of the real databases
+    scratch = tempfile.mkdtemp(prefix="portfolio-load-")
+    os.environ["CONTACT_OUTBOX_DB"] = os.path.join(scratch, "outbox.db")
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch, "analytics.db")
+
+    port = free_port()
+    proc = start_server(port)
+    rows = []
+    try:
+        # One throwaway session so imports and caches are warm before the first level
+        asyncio.run(run_level(1, port, proc.pid, 0.0, args.seed))
+        # The client runs on the same machine, so it competes with the server for CPU
+        print(f"{os.cpu_count()} CPUs, think time {args.think_ms:g} ms")
+        print(f"{'sessions':>8s} {'reruns':>7s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s}"
+              f" {'reruns/s':>9s} {'dl p95':>8s} {'RSS MB':>8s} {'KB/sess':>8s} {'errors':>7s}")
+        for n in levels:
+            row = asyncio.run(run_level(n, port, proc.pid, args.think_ms / 1000, args.seed))
+            rows.append(row)
+            print(f"{n:>8d} {row['reruns']:>7d} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f}"
+                  f" {row['reruns_per_s']:>9.1f} {row['download_p95_ms']:>8.1f} {row['rss_mb']:>8.1f} {row['rss_kb_per_session']:>8.0f}"
+                  f" {row['error_rate']:>7.1%}")
+            for sample in row["error_samples"]:
+                print(f"{'':>8s} error: {sample}")
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+    knee = next((r["sessions"] for r in rows if r["p95_ms"] > args.knee_factor * rows[0]["p95_ms"]), None)
+    if knee is None:
+        print(f"no knee up to {levels[-1]} sessions (p95 stayed within {args.knee_factor:g}x of {levels[0]})")
+    else:
+        print(f"knee: p95 passes {args.knee_factor:g}x the {levels[0]}-session p95 at {knee} sessions")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"think_ms": args.think_ms, "levels": rows, "knee": knee}, f, indent=2)
+    return 1 if any(r["error_rate"] > 0 for r in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Memory and time that the resume download button costs per 1,000 sessions.
+
+Drives Streamlit's real MediaFileManager (with the in-memory storage that
+`streamlit run` uses) the way Home does: every simulated session reruns
+Home --reruns times, registering the download button each time, and
+--click-rate of the sessions then download the resume. Three strategies:
+
+- read per rerun: f.read() on every rerun, bytes passed to download_button
+  (the original code);
+- cached bytes: one cached bytes object, pinned for the process lifetime
+  (what components.display_resume_download does now);
+- deferred: a callable returning those bytes, so reruns pass no bytes.
+  Cheapest per rerun, but the file it creates on click belongs to no
+  session, and under concurrent load another session's cleanup can delete
+  it before the browser fetches it.
+
+For each, it reports the Python memory still held after all sessions have
+run (tracemalloc), the peak while they ran, the media manager entries left
+behind, and the time spent registering the download button per rerun.
+
+    python benchmarks/media_memory.py
+    python benchmarks/media_memory.py --sessions 2000 --click-rate 0.2
+"""
+import os
+import gc
+import sys
+import time
+import argparse
+import tracemalloc
+
+from streamlit.runtime import media_file_manager
+from streamlit.runtime.media_file_manager import MediaFileManager
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+import assets  # noqa: E402
+
+RESUME_PDF = os.path.join(ROOT_DIR, assets.RESUME)
+COORDINATES = "1.(2.0).4"  # where Home's download button sits; any fixed string will do
+MIME = "application/pdf"
+FILE_NAME = "Mujakkir_Ahmad_Resume.pdf"
+
+# The manager looks up the current session from the script run context;
+# here the simulated session is set directly
+_session = ["none"]
+media_file_manager._get_session_id = lambda: _session[0]
+
+def read_per_rerun(mgr):
+    def register():
+        with open(RESUME_PDF, "rb") as f:
+            return mgr.add(f.read(), MIME, COORDINATES, FILE_NAME, is_for_static_download=True)
+    return register
+
+def cached_bytes(mgr):
+    with open(RESUME_PDF, "rb") as f:
+        data = f.read()
+    return (lambda: mgr.add(data, MIME, COORDINATES, FILE_NAME, is_for_static_download=True))
+
+def deferred(mgr):
+    with open(RESUME_PDF, "rb") as f:
+        data = f.read()
+    return (lambda: mgr.add_deferred(lambda: data, MIME, COORDINATES, FILE_NAME))
+
+STRATEGIES = {
+    "read per rerun": read_per_rerun,
+    "cached bytes": cached_bytes,
+    "deferred": deferred,
+}
+
+def simulate(make_strategy, sessions, reruns, click_every, trace):
+    gc.collect()
+    if trace:
+        tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    mgr = MediaFileManager(MemoryMediaFileStorage("/media"))
+    register = make_strategy(mgr)
+    register_s = 0.0
+    for i in range(sessions):
+        _session[0] = f"session-{i}"
+        for _ in range(reruns):
+            # What a rerun does: drop this session's old refs, then re-register
+            mgr.clear_session_refs(_session[0])
+            start = time.perf_counter()
+            file_id = register()
+            register_s += time.perf_counter() - start
+            mgr.remove_orphaned_files()
+        if click_every and i % click_every == 0 and file_id in mgr._deferred_callables:
+            mgr.execute_deferred(file_id)
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    if trace:
+        tracemalloc.stop()
+    return {
+        "held_kb": (held - base) / 1024,
+        "peak_kb": (peak - base) / 1024,
+        "stored_files": len(mgr._storage._files_by_id),
+        "deferred": len(mgr._deferred_callables),
+        "register_us": register_s / (sessions * reruns) * 1e6,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Download button memory per simulated session.")
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--reruns", type=int, default=3, help="Home reruns per session (default: 3)")
+    parser.add_argument("--click-rate", type=float, default=0.1,
+                        help="fraction of sessions that download the resume (default: 0.1)")
+    args = parser.parse_args()
+    if not os.path.exists(RESUME_PDF):
+        print(f"no resume at {RESUME_PDF}")
+        return 2
+
+    click_every = round(1 / args.click_rate) if args.click_rate > 0 else 0
+    print(f"{args.sessions:,} sessions x {args.reruns} reruns, resume {os.path.getsize(RESUME_PDF):,} bytes;"
+          f" {args.click_rate:.0%} download it")
+    print(f"{'strategy':16s} {'held KB':>10s} {'peak KB':>10s} {'files':>6s} {'deferred':>9s} {'us/rerun':>9s}")
+    for name, make_strategy in STRATEGIES.items():
+        # Memory is measured with tracemalloc on; timing in a second, untraced pass
+        r = simulate(make_strategy, args.sessions, args.reruns, click_every, trace=True)
+        r["register_us"] = simulate(make_strategy, args.sessions, args.reruns, click_every, trace=False)["register_us"]
+        print(f"{name:16s} {r['held_kb']:>10,.1f} {r['peak_kb']:>10,.1f} {r['stored_files']:>6d}"
+              f" {r['deferred']:>9d} {r['register_us']:>9,.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""Several worker processes sharing one set of state files: do they behave like one worker?
+
+Starts --workers processes that all point at the same scratch files, the
+way workers behind a load balancer would with PORTFOLIO_STATE_DB,
+CONTACT_OUTBOX_DB and PORTFOLIO_ANALYTICS_DB set, and runs each phase in
+all of them at once (a barrier lines them up):
+
+- assets: every worker builds the asset manifest into the same static
+  directory; all must succeed, and the manifest must name files that exist;
+- rate limits: one visitor submits --submits messages through every
+  worker, and one message is resubmitted through every worker from fresh
+  sessions. With the shared file the visitor gets exactly session_burst
+  accepted in total and the resubmission is accepted once; the in-process
+  backend is shown alongside for contrast (each worker counts alone);
+- outbox: every worker enqueues its own messages plus the same shared
+  idempotency keys, then all deliver at once to a local SMTP sink; every
+  key must arrive exactly once. Each worker also enqueues, first in its
+  batch, one message the sink rejects with 554 on DATA and one with a line
+  break in the sender's name, which cannot be built: those must be the
+  only rows charged an attempt. The shared messages come from a name that
+  embeds another address, which must not become the Reply-To;
+- analytics: every worker logs --events events whose labels are new to
+  the file and flushes at the same moment; none may be dropped.
+
+Exits with status 1 if any check fails.
+
+    python benchmarks/multi_worker.py
+    python benchmarks/multi_worker.py --workers 8 --events 20000
+"""
+import os
+import sys
+import time
+import email.utils
+import sqlite3
+import shutil
+import argparse
+import tempfile
+import threading
+import socketserver
+import multiprocessing
+from collections import Counter
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+import analytics  # noqa: E402
+import assets  # noqa: E402
+import outbox  # noqa: E402
+import ratelimit  # noqa: E402
+import sharedstate  # noqa: E402
+
+POISON = "rejected by the sink"
+
+# Just enough SMTP for smtplib.send_message; records the Message-ID and
+# Reply-To of each message it receives, and answers 554 to any containing POISON
+class SmtpSink(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        self.reply("220 sink")
+        while line := self.rfile.readline():
+            verb = line[:4].upper()
+            if verb == b"DATA":
+                self.reply("354 end with <CRLF>.<CRLF>")
+                lines = []
+                while (line := self.rfile.readline()) not in (b".\r\n", b""):
+                    lines.append(line)
+                if POISON.encode() in b"".join(lines):
+                    self.reply("554 message rejected")
+                    continue
+                msg = email.message_from_bytes(b"".join(lines))
+                with self.server.lock:
+                    self.server.received.append(msg["Message-ID"])
+                    self.server.reply_to[msg["Message-ID"]] = email.utils.parseaddr(msg["Reply-To"])[1]
+                self.reply("250 queued")
+            elif verb == b"QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("250 ok")
+
+def start_sink():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SmtpSink)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.received = []
+    server.reply_to = {}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def worker(index, paths, smtp_port, args, barrier, results):
+    result = {"errors": []}
+
+    barrier.wait()
+    try:
+        assets.build_manifest(static_dir=paths["static"])
+    except Exception as e:  # any failure here is what the check is looking for
+        result["errors"].append(f"assets: {e!r}")
+
+    for backend in ("memory", "shared"):
+        state = sharedstate.MemoryState() if backend == "memory" else sharedstate.SQLiteState(paths["state"])
+        guard = ratelimit.ContactGuard(state=state)
+        barrier.wait()
+        visitor = [guard.check("visitor", "203.0.113.7", "Ada", "ada@example.com", "Hello", f"note {index}.{i}")
+                   for i in range(args.submits)]
+        resubmitted = guard.check(f"session-{index}", f"198.51.100.{index}", "Bob", "bob@example.com",
+                                  "Hello", "the same message")
+        result[backend] = {"visitor": visitor.count(ratelimit.ACCEPTED),
+                           "resubmitted": int(resubmitted == ratelimit.ACCEPTED)}
+
+    box = outbox.Outbox(paths["outbox"], outbox.SmtpConfig("127.0.0.1", smtp_port), batch_size=5)
+    box.enqueue("Ada", "ada@example.com", "Hello", POISON, key=f"poison-{index}")
+    box.enqueue("Ada\r\nBcc: eve@example.com", "ada@example.com", "Hello", "unbuildable", key=f"unbuildable-{index}")
+    for i in range(args.messages):
+        box.enqueue("Ada", "ada@example.com", "Hello", f"from worker {index}", key=f"w{index}-{i}")
+        box.enqueue("Ada <eve@example.com>", "ada@example.com", "Hello", "to every worker", key=f"shared-{i}")
+    barrier.wait()
+    try:
+        # Rejected messages stay pending (two per worker, in backoff); stop once only they are left
+        while box.deliver_due() or box.pending() > 2 * args.workers:
+            time.sleep(0.01)
+    except Exception as e:
+        result["errors"].append(f"outbox: {e!r}")
+
+    log = analytics.EventLog(paths["analytics"], batch_size=args.events + 1)
+    # A first flush loads the label table, as a worker that has been up a while would have
+    log.record(analytics.PAGE_VIEW, "Home", f"worker-{index}")
+    log.flush()
+    for i in range(args.events):
+        log.record(analytics.PAGE_VIEW, f"page-{i % 11}", f"worker-{index}", f"detail-{i % 97}")
+    barrier.wait()
+    log.flush()
+    result["analytics"] = {"written": log.written, "dropped": log.dropped}
+    results.put((index, result))
+
+def main():
+    parser = argparse.ArgumentParser(description="Check shared state across worker processes.")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--submits", type=int, default=5, help="contact submissions per worker (default: 5)")
+    parser.add_argument("--messages", type=int, default=20, help="outbox messages per worker (default: 20)")
+    parser.add_argument("--events", type=int, default=5000, help="analytics events per worker (default: 5000)")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp(prefix="portfolio-workers-")
+    paths = {"static": os.path.join(scratch, "static"), "state": os.path.join(scratch, "state.db"),
+             "outbox": os.path.join(scratch, "outbox.db"), "analytics": os.path.join(scratch, "analytics.db")}
+    sink = start_sink()
+    # spawn, not fork: each worker starts from a clean interpreter, like a separate server
+    ctx = multiprocessing.get_context("spawn")
+    barrier, results = ctx.Barrier(args.workers), ctx.Queue()
+    procs = [ctx.Process(target=worker, args=(i, paths, sink.server_address[1], args, barrier, results))
+             for i in range(args.workers)]
+    start = time.perf_counter()
+    for proc in procs:
+        proc.start()
+    try:
+        by_worker = dict(results.get(timeout=300) for _ in procs)
+    finally:
+        for proc in procs:
+            proc.join(10)
+    elapsed = time.perf_counter() - start
+
+    failures = [f"worker {i}: {e}" for i, r in sorted(by_worker.items()) for e in r["errors"]]
+
+    manifest = assets.read_manifest(os.path.join(paths["static"], "manifest.json"))
+    published = [entry["file"] for entry in manifest.values() if "file" in entry]
+    published += [f for entry in manifest.values() for f in entry.get("variants", {}).values()]
+    missing = [f for f in published if not os.path.exists(os.path.join(paths["static"], f))]
+    leftovers = [f for f in os.listdir(paths["static"]) if f.endswith(".tmp")]
+    if not manifest or missing or leftovers:
+        failures.append(f"assets: {len(manifest)} manifest entries, missing {missing}, leftover {leftovers}")
+
+    burst = ratelimit.ContactGuard().session_limit[1]
+    for backend in ("memory", "shared"):
+        visitor = sum(r[backend]["visitor"] for r in by_worker.values())
+        resubmitted = sum(r[backend]["resubmitted"] for r in by_worker.values())
+        print(f"{backend + ' rate limits':22s} visitor accepted {visitor:>3d} (burst {burst}),"
+              f" resubmission accepted {resubmitted}x")
+        if backend == "shared" and (visitor != burst or resubmitted != 1):
+            failures.append(f"shared rate limits: visitor accepted {visitor}, resubmission {resubmitted}x")
+
+    keys = Counter(sink.received)
+    expected = {f"<w{w}-{i}@portfolio>" for w in range(args.workers) for i in range(args.messages)}
+    expected |= {f"<shared-{i}@portfolio>" for i in range(args.messages)}
+    duplicated = sorted(k for k, n in keys.items() if n > 1)
+    lost = sorted(expected - set(keys))
+    print(f"{'outbox':22s} {len(expected):>4d} messages, {sum(keys.values()):>4d} delivered,"
+          f" {len(duplicated)} twice, {len(lost)} lost")
+    if duplicated or lost:
+        failures.append(f"outbox: duplicated {duplicated[:5]}, lost {lost[:5]}")
+    with sqlite3.connect(paths["outbox"]) as conn:
+        charged = dict(conn.execute("SELECT idem_key, attempts FROM outbox WHERE attempts > 0"))
+    poisoned = {f"{kind}-{w}" for kind in ("poison", "unbuildable") for w in range(args.workers)}
+    print(f"{'outbox rejections':22s} {len(poisoned)} rejected messages, {len(charged)} rows charged an attempt,"
+          f" {len(poisoned & {k.strip('<>').split('@')[0] for k in keys})} rejected delivered")
+    if set(charged) != poisoned:
+        failures.append(f"outbox: rows charged an attempt {sorted(charged)[:8]}, expected only {sorted(poisoned)}")
+    spoofed = sorted(k for k, addr in sink.reply_to.items() if addr != "ada@example.com")
+    if spoofed:
+        failures.append(f"outbox: Reply-To is not the sender's address in {spoofed[:5]}")
+
+    events = args.workers * (args.events + 1)
+    written = sum(r["analytics"]["written"] for r in by_worker.values())
+    dropped = sum(r["analytics"]["dropped"] for r in by_worker.values())
+    stored = len(analytics.load_events(paths["analytics"]))
+    print(f"{'analytics':22s} {events:>6,d} events, {stored:>6,d} stored, {dropped} dropped")
+    if dropped or written != events or stored != written:
+        failures.append(f"analytics: wrote {written}, stored {stored}, dropped {dropped}")
+
+    print(f"{args.workers} workers in {elapsed:.1f} s")
+    sink.shutdown()
+    shutil.rmtree(scratch, ignore_errors=True)
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""Bytes a visitor downloads per page, in full and lite mode, against a budget.
+
+Runs every sidebar page through AppTest twice, as is and with ?lite=1, and
+counts what the browser has to fetch for it:
+- the delta messages of the run (serialized size);
+- every app/static/ file those deltas point the browser at: images,
+  the resume preview, the stylesheet. Files are counted once per page, at
+  the size the browser would receive (the .gz sibling when there is one).
+
+The Streamlit frontend itself (JS, fonts) is the same for every page and
+cached after the first visit, so it is left out. So is the resume behind
+the download button, which is only fetched on click.
+
+Exits with status 1 if any lite page exceeds --budget bytes; CI runs it
+after the rerun benchmark (.github/workflows/checks.yml).
+
+    python benchmarks/payload_budget.py
+    python benchmarks/payload_budget.py --budget 40000 --json payload.json
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from rerun import ROOT_DIR, last_deltas, new_app  # noqa: E402
+
+sys.path.insert(0, ROOT_DIR)
+import assets  # noqa: E402
+import content  # noqa: E402
+
+STATIC_REF_RE = re.compile(r'(?:src|href)="/?app/static/([^"/]+)"')
+
+# app/static/ file names the browser is sent to by these deltas
+def static_refs(deltas):
+    refs = set()
+    for m in deltas:
+        if m.delta.WhichOneof("type") != "new_element":
+            continue
+        element = m.delta.new_element
+        kind = element.WhichOneof("type")
+        if kind == "markdown":
+            refs.update(STATIC_REF_RE.findall(element.markdown.body))
+        elif kind == "imgs":
+            refs.update(img.url.rsplit("/app/static/", 1)[1] for img in element.imgs.imgs
+                        if "/app/static/" in img.url)
+    return refs
+
+def transfer_size(file_name):
+    path = os.path.join(assets.STATIC_DIR, file_name)
+    compressed = path + ".gz"
+    return os.path.getsize(compressed if os.path.exists(compressed) else path)
+
+def page_weight(page, lite):
+    at = new_app(page)
+    if lite:
+        at.query_params["lite"] = "1"
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    deltas = last_deltas()
+    refs = static_refs(deltas)
+    return {
+        "deltas": sum(m.ByteSize() for m in deltas),
+        "static": sum(transfer_size(name) for name in refs),
+        "files": sorted(refs),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Check page payloads against a byte budget.")
+    parser.add_argument("--budget", type=int, default=24 * 1024,
+                        help="most bytes a lite page may cost (default: 24576)")
+    parser.add_argument("--json", help="write the per-page results here")
+    args = parser.parse_args()
+
+    scratch = tempfile.mkdtemp()
+    os.environ["CONTACT_OUTBOX_DB"] = os.path.join(scratch, "outbox.db")
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch, "analytics.db")
+    os.environ["PORTFOLIO_LINK_CHECKS"] = "0"
+    os.chdir(ROOT_DIR)
+
+    results, failures = {}, []
+    print(f"{'page':14s} {'full':>10s} {'lite':>10s}   lite deltas + static files")
+    for page in content.NAV_PAGES:
+        full, lite = page_weight(page, False), page_weight(page, True)
+        results[page] = {"full": full, "lite": lite}
+        full_total, lite_total = full["deltas"] + full["static"], lite["deltas"] + lite["static"]
+        print(f"{page:14s} {full_total:10,d} {lite_total:10,d}   {lite['deltas']:,d} + {lite['static']:,d}"
+              f" ({len(lite['files'])} files)")
+        if lite_total > args.budget:
+            failures.append(f"{page}: lite page costs {lite_total:,d} bytes > budget {args.budget:,d}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
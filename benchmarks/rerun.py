@@ -0,0 +1,243 @@
+"""Per-page rerun benchmark for main.py, driven headlessly through AppTest.
+
+For every sidebar page, plus a contact form submission and a sidebar search,
+this records:
+- wall time per rerun (median of --repeat runs, after a warm-up run);
+- peak Python memory during one rerun (tracemalloc);
+- the number of delta messages sent;
+- their total serialized size in bytes;
+- the time to serialize them (median of 20 passes), the per-rerun cost
+  that grows with the number of deltas.
+
+The form and the search box are fragments: in the browser, interacting with
+them reruns only that fragment, so those cases run fragment-scoped too.
+
+Results are written as JSON and compared against a stored baseline. The
+process exits with status 1 if any metric regresses past the threshold.
+
+    python benchmarks/rerun.py                     # compare with baseline.json
+    python benchmarks/rerun.py --update-baseline   # accept the current numbers
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+import functools
+import platform
+import statistics
+import tempfile
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1 import local_script_runner
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_SCRIPT = os.path.join(ROOT_DIR, "main.py")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+sys.path.insert(0, ROOT_DIR)
+import content  # noqa: E402
+
+# Allowed growth over baseline: relative threshold plus absolute slack.
+# Deterministic metrics are tight; timing and memory are noisy.
+THRESHOLDS = {"deltas": 0.0, "bytes": 0.02, "wall_ms": 0.25, "peak_kb": 0.25, "ser_us": 0.5}
+SLACK = {"deltas": 0, "bytes": 0, "wall_ms": 15.0, "peak_kb": 128.0, "ser_us": 50.0}
+
+# Capture the ForwardMsgs of each run; AppTest only keeps the parsed element tree
+_last_msgs = []
+_parse_tree = local_script_runner.parse_tree_from_messages
+
+def _recording_parse_tree(msgs):
+    _last_msgs[:] = list(msgs)
+    return _parse_tree(msgs)
+
+local_script_runner.parse_tree_from_messages = _recording_parse_tree
+
+# The delta messages of the last run
+def last_deltas():
+    return [m for m in _last_msgs if m.WhichOneof("type") == "delta"]
+
+def delta_stats():
+    deltas = last_deltas()
+    passes = []
+    for _ in range(20):
+        start = time.perf_counter()
+        for m in deltas:
+            m.SerializeToString()
+        passes.append(time.perf_counter() - start)
+    return len(deltas), sum(m.ByteSize() for m in deltas), statistics.median(passes)
+
+# Fragment that rendered a widget, as the browser learns it from the widget's delta
+def fragment_of(widget):
+    for m in _last_msgs:
+        if m.WhichOneof("type") == "delta" and m.delta.WhichOneof("type") == "new_element":
+            element = m.delta.new_element
+            if getattr(getattr(element, element.WhichOneof("type")), "id", None) == widget.id:
+                return m.delta.fragment_id or None
+    return None
+
+# AppTest always reruns the whole script; scope the next run(s) to one fragment instead
+@contextlib.contextmanager
+def fragment_scope(fragment_id):
+    rerun_data = local_script_runner.RerunData
+    if fragment_id:
+        local_script_runner.RerunData = functools.partial(rerun_data, fragment_id_queue=[fragment_id])
+    try:
+        yield
+    finally:
+        local_script_runner.RerunData = rerun_data
+
+def new_app(page="Home"):
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=60)
+    at.query_params["page"] = page
+    return at
+
+def timed_run(at, fragment_id=None):
+    start = time.perf_counter()
+    with fragment_scope(fragment_id):
+        at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return elapsed
+
+def traced_run(at, fragment_id=None):
+    tracemalloc.start()
+    try:
+        with fragment_scope(fragment_id):
+            at.run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def case_result(times, peak, deltas, size, serialize):
+    return {
+        "wall_ms": round(statistics.median(times) * 1000, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "deltas": deltas,
+        "bytes": size,
+        "ser_us": round(serialize * 1e6, 1),
+    }
+
+def bench_page(page, repeat):
+    at = new_app(page)
+    timed_run(at)  # warm-up: fills process-wide caches
+    times = [timed_run(at) for _ in range(repeat)]
+    deltas, size, serialize = delta_stats()
+    peak = traced_run(at)
+    return case_result(times, peak, deltas, size, serialize)
+
+# Returns the form's fragment id
+def fill_contact_form(at, i):
+    at.text_input(key="contact_name").input("Benchmark")
+    at.text_input(key="contact_email").input("bench@example.com")
+    at.text_area(key="contact_message").input(f"Benchmark message {i} {time.time_ns()}")
+    button = at.button[0]
+    button.click()
+    return fragment_of(button)
+
+# Each submission uses a fresh session so the rate limiter does not kick in
+def bench_contact_submit(repeat):
+    times, peak = [], 0
+    for i in range(repeat + 2):
+        at = new_app("Contact")
+        at.run()
+        fragment_id = fill_contact_form(at, i)
+        if i == repeat + 1:
+            peak = traced_run(at, fragment_id)
+        elif i > 0:
+            times.append(timed_run(at, fragment_id))
+        else:
+            timed_run(at, fragment_id)
+    deltas, size, serialize = delta_stats()
+    return case_result(times, peak, deltas, size, serialize)
+
+# Typing a query into the sidebar search box
+def bench_search(repeat, query="quickbooks"):
+    at = new_app("Home")
+    at.run()
+    box = at.text_input(key="search_query")
+    fragment_id = fragment_of(box)
+    box.input(query)
+    timed_run(at, fragment_id)
+    times = [timed_run(at, fragment_id) for _ in range(repeat)]
+    deltas, size, serialize = delta_stats()
+    peak = traced_run(at, fragment_id)
+    return case_result(times, peak, deltas, size, serialize)
+
+def run_suite(repeat):
+    cases = {page: bench_page(page, repeat) for page in content.NAV_PAGES}
+    cases["Contact submit"] = bench_contact_submit(repeat)
+    cases["Search"] = bench_search(repeat)
+    return {
+        "meta": {"python": platform.python_version(), "machine": platform.machine(), "repeat": repeat},
+        "cases": cases,
+    }
+
+def compare(results, baseline, scale=1.0):
+    regressions = []
+    for case, metrics in results["cases"].items():
+        base = baseline.get("cases", {}).get(case)
+        if not base:
+            continue
+        for metric, value in metrics.items():
+            if metric not in base:
+                continue  # recorded by a newer version of this script
+            limit = base[metric] * (1 + THRESHOLDS[metric] * scale) + SLACK[metric] * scale
+            if value > limit:
+                regressions.append(f"{case}: {metric} {value:,.1f} > {base[metric]:,.1f} (limit {limit:,.1f})")
+    return regressions
+
+def print_table(results, baseline):
+    base_cases = baseline.get("cases", {})
+    print(f"{'case':16s} {'wall ms':>9s} {'peak KB':>9s} {'deltas':>7s} {'bytes':>9s} {'ser us':>7s}"
+          f"   vs baseline bytes")
+    for case, m in results["cases"].items():
+        base = base_cases.get(case, {}).get("bytes")
+        diff = f"{m['bytes'] - base:+,d}" if base is not None else "n/a"
+        print(f"{case:16s} {m['wall_ms']:9.1f} {m['peak_kb']:9.0f} {m['deltas']:7d} {m['bytes']:9,d}"
+              f" {m['ser_us']:7.1f}   {diff}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reruns of main.py per page.")
+    parser.add_argument("--repeat", type=int, default=5, help="timed reruns per case (default: 5)")
+    parser.add_argument("--out", help="write results JSON here")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--threshold-scale", type=float, default=1.0, help="multiply every regression threshold")
+    parser.add_argument("--update-baseline", action="store_true", help="overwrite the baseline with these results")
+    args = parser.parse_args()
+
+    # Keep benchmark submissions and page views out of the real databases and never send mail
+    scratch = tempfile.mkdtemp()
+    os.environ["CONTACT_OUTBOX_DB"] = os.path.join(scratch, "outbox.db")
+    os.environ["PORTFOLIO_ANALYTICS_DB"] = os.path.join(scratch, "analytics.db")
+    os.environ.pop("CONTACT_SMTP_HOST", None)
+    # Link badges depend on the network; leave them out so byte counts are stable
+    os.environ["PORTFOLIO_LINK_CHECKS"] = "0"
+    os.chdir(ROOT_DIR)
+
+    results = run_suite(args.repeat)
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline updated: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold_scale)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
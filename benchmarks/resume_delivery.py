@@ -0,0 +1,163 @@
+"""Bytes transferred for the resume, measured against a local `streamlit run asgi.py`.
+
+Starts the server on a free port, then:
+- fetches the resume the way a browser's first request does (Accept-Encoding:
+  gzip, deflate, br, zstd, no Range), checking the response is uncompressed
+  and carries "Accept-Ranges: bytes": PDF viewers (pdf.js) only switch to
+  range requests when it does;
+- opens page one the way a PDF viewer does, fetching fixed-size byte ranges
+  on demand (pypdf reading through an HTTP Range-backed file), and checks
+  that every range comes back as a 206 of the right length.
+
+Exits with status 1 if any check fails or if page one costs more than
+--max-first-page-kb.
+
+    python benchmarks/resume_delivery.py
+    python benchmarks/resume_delivery.py --chunk-kb 64   # pdf.js default range size
+"""
+import io
+import os
+import sys
+import time
+import json
+import socket
+import argparse
+import subprocess
+import urllib.error
+import urllib.request
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANIFEST = os.path.join(ROOT_DIR, "static", "manifest.json")
+
+# What Chrome sends on a plain navigation or iframe load
+BROWSER_ACCEPT_ENCODING = "gzip, deflate, br, zstd"
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(port):
+    env = dict(os.environ, PORTFOLIO_LINK_CHECKS="0")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "asgi.py", "--server.port", str(port),
+         "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        cwd=ROOT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=2):
+                return proc
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.5)
+    proc.kill()
+    raise RuntimeError("server did not become healthy")
+
+def fetch(url, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    with urllib.request.urlopen(request) as response:
+        return response.status, response.headers, response.read()
+
+# A read-only file whose bytes come from HTTP Range requests, one chunk at a time
+class RangeFile(io.RawIOBase):
+    def __init__(self, url, size, chunk):
+        self.url, self.size, self.chunk = url, size, chunk
+        self.pos = 0
+        self.chunks = {}
+        self.transferred = 0
+        self.errors = []
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.pos, io.SEEK_END: self.size}[whence]
+        self.pos = base + offset
+        return self.pos
+
+    def tell(self):
+        return self.pos
+
+    def _chunk(self, index):
+        if index not in self.chunks:
+            start = index * self.chunk
+            end = min(start + self.chunk, self.size) - 1
+            status, headers, body = fetch(self.url, {"Range": f"bytes={start}-{end}"})
+            expected = f"bytes {start}-{end}/{self.size}"
+            if status != 206 or headers.get("Content-Range") != expected or len(body) != end - start + 1:
+                self.errors.append(f"range {start}-{end}: HTTP {status}, {headers.get('Content-Range')}")
+            self.transferred += len(body)
+            self.chunks[index] = body
+        return self.chunks[index]
+
+    def readinto(self, buffer):
+        n = min(len(buffer), self.size - self.pos)
+        if n <= 0:
+            return 0
+        out = bytearray()
+        while len(out) < n:
+            index, offset = divmod(self.pos + len(out), self.chunk)
+            out += self._chunk(index)[offset:offset + n - len(out)]
+        buffer[:n] = out
+        self.pos += n
+        return n
+
+def first_page_view(url, size, chunk):
+    from pypdf import PdfReader
+
+    ranged = RangeFile(url, size, chunk)
+    text = PdfReader(io.BufferedReader(ranged, buffer_size=4096)).pages[0].extract_text()
+    return ranged, text
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure resume delivery against a local server.")
+    parser.add_argument("--chunk-kb", type=int, default=16, help="range request size (default: 16)")
+    parser.add_argument("--max-first-page-kb", type=float, default=192.0,
+                        help="fail if opening page one transfers more than this (default: 192)")
+    args = parser.parse_args()
+
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        print("pypdf is required for the first-page check: pip install pypdf")
+        return 2
+
+    port = free_port()
+    proc = start_server(port)
+    failures = []
+    try:
+        with open(MANIFEST) as f:
+            url = f"http://127.0.0.1:{port}/app/static/{json.load(f)['resume.pdf']['file']}"
+
+        status, headers, plain = fetch(url, {"Accept-Encoding": BROWSER_ACCEPT_ENCODING})
+        encoding = headers.get("Content-Encoding", "identity")
+        accept_ranges = headers.get("Accept-Ranges", "")
+        if status != 200 or encoding != "identity" or accept_ranges != "bytes":
+            failures.append(f"first GET: HTTP {status}, Content-Encoding {encoding},"
+                            f" Accept-Ranges {accept_ranges or 'missing'}; a PDF viewer would not use ranges")
+
+        ranged, text = first_page_view(url, len(plain), args.chunk_kb * 1024)
+        failures += ranged.errors
+        if not text.strip():
+            failures.append("page one has no text; the ranged read went wrong")
+        first_kb = ranged.transferred / 1024
+        if first_kb > args.max_first_page_kb:
+            failures.append(f"page one transferred {first_kb:,.1f} KB > {args.max_first_page_kb:,.1f} KB")
+
+        print(f"{'first GET (' + encoding + ')':34s} {len(plain):>9,d} bytes, Accept-Ranges: {accept_ranges or '-'}")
+        print(f"{f'page one, {args.chunk_kb} KB ranges':34s} {ranged.transferred:>9,d} bytes"
+              f"  ({len(ranged.chunks)} requests, {ranged.transferred / len(plain):.0%} of the file)")
+    finally:
+        proc.terminate()
+        proc.wait(10)
+
+    for line in failures:
+        print(f"FAIL {line}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""Filter latency of the Sales & Deposit demo on the Projects page.
+
+Two measurements:
+- the engine alone (salesdemo.py): load time, then summary() for --combos
+  random filter combinations, uncached and again from the LRU, and the
+  number of points the hourly series is cut down to;
+- the page, through AppTest: the demo is opened once, then every filter
+  change reruns only the demo fragment, as in the browser. Reported as the
+  median and p95 of those reruns, with the chart payload they sent.
+
+Exits with status 1 if the p95 filter rerun exceeds --budget-ms.
+
+    python benchmarks/sales_demo.py
+    python benchmarks/sales_demo.py --combos 50 --budget-ms 100
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from rerun import ROOT_DIR, delta_stats, fragment_of, new_app, timed_run  # noqa: E402
+
+sys.path.insert(0, ROOT_DIR)
+import salesdemo  # noqa: E402
+
+def random_filters(rng, data):
+    executives = tuple(sorted(rng.sample(data.executives, rng.randint(0, 3))))
+    regions = tuple(sorted(rng.sample(data.regions, rng.randint(0, 2))))
+    first = rng.randrange(salesdemo.MONTHS)
+    return executives, regions, (first, rng.randrange(first, salesdemo.MONTHS))
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, round(q * (len(values) - 1)))]
+
+def bench_engine(combos, seed):
+    start = time.perf_counter()
+    data = salesdemo.load()
+    load_s = time.perf_counter() - start
+    rng = random.Random(seed)
+    filters = [random_filters(rng, data) for _ in range(combos)]
+    cold, warm, points = [], [], 0
+    for f in filters:
+        start = time.perf_counter()
+        summary = data.summary(*f)
+        cold.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        data.summary(*f)
+        warm.append(time.perf_counter() - start)
+        points = max(points, len(summary["hourly"][0]))
+    return data, load_s, cold, warm, points
+
+def bench_page(data, combos, seed):
+    at = new_app("Projects")
+    at.run()
+    toggle = at.toggle(key="sales_demo_open")
+    fragment_id = fragment_of(toggle)
+    toggle.set_value(True)
+    timed_run(at, fragment_id)  # opens the demo and loads the data
+    rng = random.Random(seed + 1)
+    times, sizes = [], []
+    for _ in range(combos):
+        executives, regions, months = random_filters(rng, data)
+        at.multiselect(key="sales_executives").set_value(list(executives))
+        at.multiselect(key="sales_regions").set_value(list(regions))
+        at.select_slider(key="sales_months").set_value(months)
+        times.append(timed_run(at, fragment_id))
+        sizes.append(delta_stats()[1])
+    return times, sizes
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure filter latency of the sales demo.")
+    parser.add_argument("--combos", type=int, default=30, help="random filter combinations (default: 30)")
+    parser.add_argument("--budget-ms", type=float, default=100.0, help="fail if the p95 rerun is slower (default: 100)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    os.environ["PORTFOLIO_LINK_CHECKS"] = "0"
+    os.chdir(ROOT_DIR)
+
+    data, load_s, cold, warm, points = bench_engine(args.combos, args.seed)
+    print(f"{len(data):,} transactions loaded in {load_s * 1000:,.0f} ms; hourly series cut to {points:,} points")
+    print(f"{'summary(), uncached':28s} p50 {statistics.median(cold) * 1000:7.1f} ms"
+          f"   p95 {percentile(cold, 0.95) * 1000:7.1f} ms")
+    print(f"{'summary(), from the LRU':28s} p50 {statistics.median(warm) * 1e6:7.1f} us"
+          f"   p95 {percentile(warm, 0.95) * 1e6:7.1f} us")
+
+    times, sizes = bench_page(data, args.combos, args.seed)
+    p95 = percentile(times, 0.95) * 1000
+    print(f"{'filter rerun (fragment)':28s} p50 {statistics.median(times) * 1000:7.1f} ms   p95 {p95:7.1f} ms"
+          f"   {statistics.median(sizes) / 1024:,.0f} KB sent")
+    if p95 > args.budget_ms:
+        print(f"FAIL p95 filter rerun {p95:,.1f} ms > {args.budget_ms:,.1f} ms")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+"""Shared Streamlit helpers: styles, images, resume, card() and the content registry.
+
+Imported once per process. main.py and the page modules in views/ call these
+on every rerun; nothing here runs at import time except the definitions.
+"""
+import os
+import time
+import atexit
+import uuid
+import importlib
+import threading
+from functools import partial
+from html import escape
+
+import streamlit as st
+
+import analytics
+import assets
+import content
+import linkcheck
+import markup
+import metrics
+import search
+
+# -----------------------------
+# Styles — bundled into one minified, content-hashed stylesheet (see assets.py)
+# -----------------------------
+# Build the bundle once per styles.css version (mtime is None when the file is absent)
+# (looked up in the build-time manifest first; see assets.py)
+@st.cache_resource(show_spinner=False)
+def build_css_bundle(file_path, mtime):
+    entry = assets.manifest_entry(file_path)
+    if entry:
+        return f"app/static/{entry['file']}"
+    metrics.inc("asset_loads", asset="css")
+    return f"app/static/{assets.build_css_bundle(file_path)}"
+
+# Reruns only emit a <link> to the cached bundle; styles.css is optional
+@metrics.timed("load_css")
+def load_css(file_path):
+    try:
+        mtime = os.path.getmtime(file_path) if os.path.exists(file_path) else None
+        url = build_css_bundle(file_path, mtime)
+        st.markdown(f'<link rel="stylesheet" href="{url}">', unsafe_allow_html=True)
+    except Exception:
+        # Fallback to embedded CSS if the bundle cannot be built
+        css = assets.minify_css("".join(assets.BUILTIN_CSS))
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
+
+# -----------------------------
+# Lite mode — for slow connections: no resume preview, small images, plain sidebar, no animations
+# -----------------------------
+LITE_ECT = ("slow-2g", "2g", "3g")  # effective connection types that get lite pages
+LITE_IMAGE_WIDTH = 160
+
+# ?lite=1 (or ?lite=0) decides; otherwise the browser's Save-Data and ECT
+# client hints do (asgi.py asks for ECT with Accept-CH)
+def lite_mode():
+    requested = st.query_params.get("lite")
+    if requested is not None:
+        return requested not in ("0", "false", "")
+    headers = st.context.headers
+    return headers.get("Save-Data", "").lower() == "on" or headers.get("ECT", "").lower() in LITE_ECT
+
+# -----------------------------
+# Assets
+# -----------------------------
+STYLES_CSS = os.path.join("styles.css")
+PROFILE_IMG_1 = os.path.join("mujakkir_profile.png")
+PROFILE_IMG_2 = os.path.join("profile.png")
+RESUME_PDF = os.path.join("resume.pdf")
+
+# Resize and re-encode an image once per file version; returns {width: URL}.
+# st.image passes /app/static/ URLs straight to the browser, so the images
+# skip the media pipeline and are cached under their content-hashed names
+@st.cache_resource(show_spinner=False)
+def image_variants(image_path, mtime):
+    entry = assets.manifest_entry(image_path)
+    if entry:
+        variants = {int(w): name for w, name in entry["variants"].items()}
+    else:
+        metrics.inc("asset_loads", asset="image")
+        variants = assets.build_image_variants(image_path)
+    return {w: f"/app/static/{name}" for w, name in variants.items()}
+
+# Helper function to display images with fallback
+@metrics.timed("display_image")
+def display_image(image_path, caption, width=300):
+    try:
+        if os.path.exists(image_path):
+            variants = image_variants(image_path, os.path.getmtime(image_path))
+            if lite_mode():
+                width = LITE_IMAGE_WIDTH
+            return st.image(assets.pick_variant(variants, width), caption=caption, width="stretch")
+        else:
+            st.info(f"Add your {caption} image at {image_path}")
+            return None
+    except Exception as e:
+        st.error(f"Error loading image: {e}")
+        return None
+
+# A grey box the size of an image or of the resume preview, held in the
+# layout until the media is rendered into it; returns the slot
+def media_placeholder(kind):
+    return st.markdown(f'<div class="media-placeholder {kind}"></div>', unsafe_allow_html=True)
+
+# Load the resume once per file version (keyed by mtime) and publish a
+# content-hashed copy; returns (bytes, preview URL)
+@st.cache_resource(show_spinner=False)
+def load_resume(pdf_path, mtime):
+    entry = assets.manifest_entry(pdf_path)
+    if entry:
+        file_name = entry["file"]
+        with open(os.path.join(assets.STATIC_DIR, file_name), "rb") as f:
+            data = f.read()
+    else:
+        metrics.inc("asset_loads", asset="resume")
+        data, file_name = assets.publish_resume(pdf_path)
+    return data, f"app/static/{file_name}"
+
+# Helper function for PDF download with fallback; lite pages skip the preview.
+# Every session's button gets the same cached bytes object.
+# (Not a deferred callable: Streamlit leaves the file a deferred download
+# creates unowned, and another session's cleanup can delete it before the
+# browser fetches it, which is a 404 under concurrent load.)
+@metrics.timed("display_resume_download")
+def display_resume_download(pdf_path):
+    try:
+        if os.path.exists(pdf_path):
+            data, url = load_resume(pdf_path, os.path.getmtime(pdf_path))
+            if not lite_mode():
+                pdf_display = f'<iframe src="{url}" width="100%" height="600px" type="application/pdf"></iframe>'
+                st.markdown(pdf_display, unsafe_allow_html=True)
+
+            st.download_button(
+                label="📄 Download Resume",
+                data=data,
+                file_name="Mujakkir_Ahmad_Resume.pdf",
+                mime="application/pdf",
+                width="stretch",
+                on_click=track, args=(analytics.RESUME_DOWNLOAD, "Home"),
+            )
+        else:
+            st.warning(f"Add your resume at {pdf_path} to enable download and preview.")
+    except Exception as e:
+        st.error(f"Error loading resume: {e}")
+
+# -----------------------------
+# Analytics — events go to an in-memory buffer, flushed to SQLite in the background (see analytics.py)
+# -----------------------------
+# stop() flushes what is still buffered, so a restart does not lose the last interval
+@st.cache_resource(show_spinner=False)
+def get_event_log():
+    log = analytics.EventLog().start()
+    atexit.register(log.stop)
+    return log
+
+# Random per-session id shared by the rate limiter and analytics
+def visitor_id():
+    return st.session_state.setdefault("visitor_id", uuid.uuid4().hex)
+
+def track(kind, page="", detail=""):
+    get_event_log().record(kind, page, visitor_id(), detail)
+
+# -----------------------------
+# Link health — probed in the background (see linkcheck.py), shown as a badge on cards
+# -----------------------------
+@st.cache_resource(show_spinner=False)
+def get_link_monitor():
+    return linkcheck.LinkMonitor().start()
+
+# Reads the cached status only; PORTFOLIO_LINK_CHECKS=0 turns the badge off
+def link_badge(url):
+    if os.environ.get("PORTFOLIO_LINK_CHECKS") == "0":
+        return ""
+    status = get_link_monitor().get(url)
+    if status is None:
+        return "<span class='link-status'>⚪ Checking…</span>"
+    text = f"🟢 Online · {status.elapsed_ms:.0f} ms" if status.ok else "🔴 Unreachable"
+    return f"<span class='link-status' title='{escape(status.title or status.error)}'>{text}</span>"
+
+# -----------------------------
+# Helper — Card component
+# -----------------------------
+# One pre-rendered element per card (see markup.py); only the link badge varies between reruns
+@metrics.timed("card")
+def card(title: str, subtitle: str = "", body: str = "", link_text: str = "", link_url: str = "", icon: str = ""):
+    item = content.Card(title, subtitle, body, link_text, link_url, icon)
+    badge = link_badge(link_url) if link_url else ""
+    st.markdown(markup.render_item("card", item, badge), unsafe_allow_html=True)
+
+# -----------------------------
+# Content registry — content.json parsed once per process, shared by all sessions
+# -----------------------------
+# Keyed by the page's own JSON, so an edit to content.json only re-parses the pages it touched
+parse_page = st.cache_resource(show_spinner=False, max_entries=64)(content.parse_page)
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def load_content(content_path, mtime):
+    return {name: parse_page(raw) for name, raw in content.read_pages(content_path)}
+
+# Every item is one pre-rendered, memoized HTML element, except metrics (a native
+# widget) and jobs, whose expander is native but whose body is one element
+def render_item(kind, item):
+    if kind == "card":
+        card(*item)
+    elif kind == "job":
+        with st.expander(item.title, expanded=item.expanded):
+            st.markdown(markup.render_job_body(item), unsafe_allow_html=True)
+    elif kind == "metric":
+        st.metric(item.label, item.value, help=item.help or None)
+    else:
+        st.markdown(markup.render_item(kind, item), unsafe_allow_html=True)
+
+# Lay a group's items out in rows of `columns`
+def render_groups(groups):
+    for group in groups:
+        if group.heading:
+            st.markdown(f"## {group.heading}")
+        for i in range(0, len(group.items), group.columns):
+            row = group.items[i:i + group.columns]
+            if group.columns == 1:
+                for item in row:
+                    render_item(group.kind, item)
+            else:
+                for col, item in zip(st.columns(group.columns), row):
+                    with col:
+                        render_item(group.kind, item)
+
+# Current content, re-read only when content.json changes
+def get_site():
+    return load_content(content.CONTENT_JSON, os.path.getmtime(content.CONTENT_JSON))
+
+# Body of the registry-driven pages (Projects, Services, Skills, ...)
+def render_section(name):
+    section = get_site()[name]
+    st.markdown(f"# {section.title}")
+    render_groups(section.groups)
+
+# -----------------------------
+# Search — inverted index over content.json and the resume text (see search.py)
+# -----------------------------
+@st.cache_resource(show_spinner=False)
+def resume_text(pdf_path, mtime):
+    return search.extract_pdf_text(pdf_path)
+
+@st.cache_resource(show_spinner=False)
+def _search_state():
+    return {"lock": threading.Lock(), "index": None, "site": None, "resume": None}
+
+# Rebuilt when content.json or the resume changes; unchanged pages keep their tokens
+def get_search_index():
+    site = get_site()
+    resume = resume_text(RESUME_PDF, os.path.getmtime(RESUME_PDF)) if os.path.exists(RESUME_PDF) else ()
+    state = _search_state()
+    with state["lock"]:
+        if state["index"] is None or state["site"] is not site or state["resume"] is not resume:
+            state.update(index=search.build_index(site, resume, previous=state["index"]), site=site, resume=resume)
+        return state["index"]
+
+# Picking a sidebar page (or a search hit) leaves a hidden page opened by URL
+def leave_hidden_page():
+    if st.query_params.get("page") in content.HIDDEN_PAGES:
+        del st.query_params["page"]
+
+# Records the hit's title, not the typed query: titles come from content.json,
+# so they cannot grow the analytics label table without bound
+def _go_to_page(page, title):
+    track(analytics.SEARCH_CLICK, page, title)
+    leave_hidden_page()
+    st.session_state["nav_page"] = page
+
+# Sidebar search box (call inside `with st.sidebar`). A fragment: typing a query
+# reruns only the search results; picking a hit reruns the app on that page
+@st.fragment
+def search_box():
+    query = st.text_input("🔎 Search", key="search_query", placeholder="QuickBooks, Plotly, Power BI…")
+    if not query.strip():
+        return
+    with metrics.span("search"):
+        hits = get_search_index().search(query)
+    if not hits:
+        st.caption("No matches.")
+    for i, hit in enumerate(hits):
+        if st.button(
+            f"{hit.page} · {hit.title}", key=f"search_hit_{i}", help=hit.snippet,
+            on_click=_go_to_page, args=(hit.page, hit.title), width="stretch",
+        ):
+            st.rerun()
+
+# -----------------------------
+# Prewarm — fill the process-wide caches before the first visitor does
+# -----------------------------
+def _mtime(path):
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+def _warm_images():
+    for path in (PROFILE_IMG_1, PROFILE_IMG_2):
+        if os.path.exists(path):
+            image_variants(path, _mtime(path))
+
+def _warm_resume():
+    if os.path.exists(RESUME_PDF):
+        load_resume(RESUME_PDF, _mtime(RESUME_PDF))
+
+# Schedules the first probe of every project link, so badges have a status
+def _warm_links():
+    for page in get_site().values():
+        for group in page.groups:
+            for item in group.items:
+                if getattr(item, "link_url", ""):
+                    link_badge(item.link_url)
+
+# Streamlit's own first-run costs, found by profiling the first session of a
+# fresh server: the emoji table behind set_page_config(page_icon=...), numpy
+# behind st.image, and the module-path cache that inspect builds when
+# Streamlit checks (once) whether it runs in a REPL
+def _warm_streamlit():
+    import inspect
+    import numpy  # noqa: F401
+    import streamlit.emojis  # noqa: F401
+
+    inspect.stack()
+
+# The same calls, with the same arguments, as the first run of each page (so
+# the cache keys match), plus the page modules themselves. Safe to run from a
+# background thread. Returns {step: seconds}; each step is also a "prewarm" span
+def prewarm(pages=content.NAV_PAGES):
+    steps = [
+        ("streamlit", _warm_streamlit),
+        ("css", lambda: build_css_bundle(STYLES_CSS, _mtime(STYLES_CSS))),
+        ("content", get_site),
+        ("images", _warm_images),
+        ("resume", _warm_resume),
+        ("search", get_search_index),
+        ("analytics", get_event_log),
+        ("links", _warm_links),
+    ]
+    steps += [(f"views.{name.lower()}", partial(importlib.import_module, f"views.{name.lower()}")) for name in pages]
+    timings = {}
+    for step, warm in steps:
+        start = time.perf_counter()
+        with metrics.span("prewarm", step=step):
+            warm()
+        timings[step] = time.perf_counter() - start
+    return timings
@@ -0,0 +1,143 @@
+"""Portfolio content: records parsed from content.json plus the shared sidebar/footer markup.
+
+main.py caches the parsed pages per process, and export.py renders the
+same records to static HTML.
+"""
+import os
+import json
+from typing import NamedTuple
+
+CONTENT_JSON = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content.json")
+
+# Sidebar order; also the set of valid ?page= values
+NAV_PAGES = [
+    "Home",
+    "Projects",
+    "Services",
+    "Skills",
+    "Experience",
+    "Education",
+    "Testimonials",
+    "Contact",
+]
+
+# Pages left out of the sidebar; reachable only by URL (?page=Analytics)
+HIDDEN_PAGES = ["Analytics"]
+
+SIDEBAR_CONTACT_HTML = """
+<div class="sidebar-card spaced">
+    <h3>Contact Info</h3>
+    <p><span class="icon">👤</span> <strong>Mujakkir Ahmad</strong></p>
+    <p><span class="icon">🏠</span> Sher-E-Bangla Nagar</p>
+    <p><span class="icon">📧</span> <a href="mailto:mujakkir.dv@gmail.com">mujakkir.dv@gmail.com</a></p>
+    <p><span class="icon">📱</span> +8801787933422</p>
+</div>
+"""
+
+SIDEBAR_SOCIAL_HTML = """
+<div class="sidebar-card">
+    <h4>Connect With Me</h4>
+    <div class="social-links">
+        <a href="https://linkedin.com/in/mujakkir-dv" target="_blank" title="LinkedIn"><span>🔗</span></a>
+        <a href="https://github.com/mujakkirdv" target="_blank" title="GitHub"><span>💻</span></a>
+        <a href="mailto:mujakkir.dv@gmail.com" title="Email"><span>📧</span></a>
+    </div>
+</div>
+"""
+
+# Lite mode: the same details as plain Markdown, no styled cards
+SIDEBAR_LITE_MD = """
+**Mujakkir Ahmad** · Sher-E-Bangla Nagar  
+📧 [mujakkir.dv@gmail.com](mailto:mujakkir.dv@gmail.com) · 📱 +8801787933422  
+[LinkedIn](https://linkedin.com/in/mujakkir-dv) · [GitHub](https://github.com/mujakkirdv)
+"""
+
+FOOTER_HTML = """
+<div class="footer">
+    © 2025 Mujakkir Ahmad | mujakkir.dv@gmail.com | All Rights Reserved
+</div>
+"""
+
+# -----------------------------
+# Records
+# -----------------------------
+class Card(NamedTuple):
+    title: str
+    subtitle: str = ""
+    body: str = ""
+    link_text: str = ""
+    link_url: str = ""
+    icon: str = ""
+
+class Skill(NamedTuple):
+    title: str
+    body: str
+
+class Job(NamedTuple):
+    title: str
+    period: str
+    body: str
+    expanded: bool = False
+
+class Degree(NamedTuple):
+    title: str
+    institution: str
+    detail: str
+
+class Testimonial(NamedTuple):
+    quote: str
+    author: str
+
+class Certification(NamedTuple):
+    title: str
+    issuer: str
+    body: str
+
+class Metric(NamedTuple):
+    label: str
+    value: str
+    help: str = ""
+
+class Group(NamedTuple):
+    kind: str
+    items: tuple
+    heading: str = ""
+    columns: int = 1
+
+class Page(NamedTuple):
+    title: str
+    groups: tuple = ()
+    text: dict = {}
+
+RECORD_TYPES = {
+    "card": Card,
+    "skill": Skill,
+    "job": Job,
+    "degree": Degree,
+    "testimonial": Testimonial,
+    "certification": Certification,
+    "metric": Metric,
+}
+
+# Yields (name, raw JSON) per page; the raw text doubles as a cache key for parse_page
+def read_pages(content_path=CONTENT_JSON):
+    with open(content_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    for name, page in data.items():
+        yield name, json.dumps(page, sort_keys=True, ensure_ascii=False)
+
+def parse_page(raw):
+    page = json.loads(raw)
+    groups = tuple(
+        Group(
+            kind=g["kind"],
+            items=tuple(RECORD_TYPES[g["kind"]](**item) for item in g["items"]),
+            heading=g.get("heading", ""),
+            columns=g.get("columns", 1),
+        )
+        for g in page.get("groups", [])
+    )
+    return Page(title=page["title"], groups=groups, text=page.get("text", {}))
+
+def load_content(content_path=CONTENT_JSON):
+    return {name: parse_page(raw) for name, raw in read_pages(content_path)}
@@ -0,0 +1,161 @@
+"""Export the portfolio as a static site.
+
+Renders every page in content.NAV_PAGES to plain HTML with the CSS bundle,
+image variants and resume copied alongside, so the site can be served from
+any static host. The contact form stays dynamic: the Contact page links to
+the live Streamlit app (opened with ?page=Contact).
+
+    python export.py --out site --app-url https://webmujakkir.streamlit.app
+"""
+import os
+import argparse
+from html import escape
+
+import assets
+import content
+from markup import inline, markdown_to_html, render_item
+
+DEFAULT_APP_URL = "https://webmujakkir.streamlit.app"
+
+PROFILE_IMAGES = [
+    os.path.join(assets.ROOT_DIR, "mujakkir_profile.png"),
+    os.path.join(assets.ROOT_DIR, "profile.png"),
+]
+RESUME_PDF = os.path.join(assets.ROOT_DIR, "resume.pdf")
+
+# Layout rules for the exported pages (Streamlit provides these in the live app;
+# the item styles both share are assets.CARD_CSS)
+EXPORT_CSS = """
+    body { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; color: #31333f; }
+    .layout { display: flex; min-height: 100vh; background: #fff; }
+    .sidebar { width: 300px; flex-shrink: 0; padding: 24px 16px; background: #f0f2f6; }
+    .sidebar nav a { display: block; padding: 4px 0; color: #31333f; text-decoration: none; }
+    .sidebar nav a.active { font-weight: 700; }
+    main { flex: 1; padding: 24px 48px 80px; max-width: 1200px; }
+    .row { display: grid; gap: 16px; margin-bottom: 16px; }
+    .cols-1 { grid-template-columns: 1fr; }
+    .cols-2 { grid-template-columns: repeat(2, 1fr); }
+    .cols-3 { grid-template-columns: repeat(3, 1fr); }
+    .hero { grid-template-columns: 1fr 2fr; gap: 48px; }
+    .card { background: #fff; }
+    details { border: 1px solid #e2e8f0; border-radius: 8px; padding: 8px 16px; margin-bottom: 8px; }
+    summary { cursor: pointer; font-weight: 600; }
+    figure { margin: 0 0 16px; }
+    figure img { width: 100%; height: auto; }
+    figcaption { text-align: center; color: #808495; font-size: 14px; }
+    .metric-label { color: var(--muted); font-size: 14px; }
+    .metric-value { color: var(--brand); font-size: 2.25rem; }
+    @media (max-width: 768px) {
+        .layout { flex-direction: column; }
+        .sidebar { width: auto; }
+        main { padding: 16px 16px 80px; }
+        .cols-2, .cols-3, .hero { grid-template-columns: 1fr; }
+    }
+"""
+
+def page_file(name):
+    return "index.html" if name == "Home" else f"{name.lower()}.html"
+
+def render_groups(groups):
+    html = []
+    for group in groups:
+        if group.heading:
+            html.append(f"<h2>{inline(group.heading)}</h2>")
+        for i in range(0, len(group.items), group.columns):
+            cells = "".join(render_item(group.kind, item) for item in group.items[i:i + group.columns])
+            html.append(f"<div class='row cols-{group.columns}'>{cells}</div>")
+    return "\n".join(html)
+
+def render_image(variants, caption, width=300):
+    srcset = ", ".join(f"assets/{name} {w}w" for w, name in sorted(variants.items()))
+    return (f'<figure><img src="assets/{assets.pick_variant(variants, width)}" srcset="{srcset}" '
+            f'sizes="(max-width: 768px) 100vw, 320px" alt="{escape(caption)}" loading="lazy">'
+            f"<figcaption>{escape(caption)}</figcaption></figure>")
+
+def render_home(page, images, resume_file):
+    left = [render_image(images[0], "Mujakkir Ahmad")]
+    if resume_file:
+        left.append(f'<iframe src="assets/{resume_file}" width="100%" height="600px" type="application/pdf"></iframe>')
+        left.append(f'<a class="button" href="assets/{resume_file}" download="Mujakkir_Ahmad_Resume.pdf">📄 Download Resume</a>')
+    left.append(render_image(images[1], "Mujakkir Ahmad"))
+    right = [
+        f"<h1>{inline(page.title)}</h1>",
+        markdown_to_html(page.text["intro"]),
+        f"<h2>{inline(page.text['why_title'])}</h2>",
+        markdown_to_html(page.text["why"]),
+        render_groups(page.groups),
+    ]
+    return f"<div class='row hero'><div>{''.join(left)}</div><div>{''.join(right)}</div></div>"
+
+def render_contact(page, app_url):
+    form_url = f"{app_url.rstrip('/')}/?page=Contact"
+    left = (f"<p>{inline(page.text['intro'])}</p>"
+            f'<a class="button" href="{escape(form_url)}">✉️ Send a Message</a>')
+    right = f"<h3>{inline(page.text['details_title'])}</h3>{markdown_to_html(page.text['details'])}"
+    return f"<h1>{inline(page.title)}</h1><div class='row cols-2'><div>{left}</div><div>{right}</div></div>"
+
+def render_document(name, body, css_file):
+    nav = "".join(
+        f'<a href="{page_file(p)}"{" class=active" if p == name else ""}>{p}</a>' for p in content.NAV_PAGES
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{escape(name)} · Mujakkir Ahmad — Data Analyst Portfolio</title>
+<link rel="stylesheet" href="assets/{css_file}">
+</head>
+<body>
+<div class="layout">
+<aside class="sidebar">
+<h2>📌 Navigation</h2>
+<nav>{nav}</nav>
+<hr>
+{content.SIDEBAR_CONTACT_HTML}
+{content.SIDEBAR_SOCIAL_HTML}
+</aside>
+<main>
+{body}
+</main>
+</div>
+{content.FOOTER_HTML}
+</body>
+</html>
+"""
+
+# -----------------------------
+# Export
+# -----------------------------
+def export_site(out_dir, app_url=DEFAULT_APP_URL):
+    asset_dir = os.path.join(out_dir, "assets")
+    css_file = assets.build_css_bundle(os.path.join(assets.ROOT_DIR, "styles.css"), asset_dir, EXPORT_CSS)
+    images = [assets.build_image_variants(path, asset_dir) for path in PROFILE_IMAGES]
+    resume_file = assets.publish_resume(RESUME_PDF, asset_dir)[1] if os.path.exists(RESUME_PDF) else None
+    site = content.load_content()
+
+    written = []
+    for name in content.NAV_PAGES:
+        page = site[name]
+        if name == "Home":
+            body = render_home(page, images, resume_file)
+        elif name == "Contact":
+            body = render_contact(page, app_url)
+        else:
+            body = f"<h1>{inline(page.title)}</h1>\n{render_groups(page.groups)}"
+        path = os.path.join(out_dir, page_file(name))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(render_document(name, body, css_file))
+        written.append(path)
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the portfolio as static HTML.")
+    parser.add_argument("--out", default="site", help="output directory (default: site)")
+    parser.add_argument("--app-url", default=DEFAULT_APP_URL, help="live app that handles the contact form")
+    args = parser.parse_args()
+    for path in export_site(args.out, args.app_url):
+        print(f"wrote {path} ({os.path.getsize(path):,} bytes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""Expense forecasting for the demo on the Projects page: models, rolling-origin backtests, memoized fits.
+
+Three model families, each in a few parameterizations (CONFIGS): moving
+average, simple exponential smoothing and a least-squares linear trend.
+Every model is online: fitting is a sequence of update() calls on a small
+state, and forecast() reads the state. So a rolling-origin backtest is a
+single pass over the series: at each origin, forecast the next HORIZON
+months, then feed in the actual month and score the forecasts that were
+waiting for it. A Backtest is that pass, frozen after its last month.
+
+Backtests are memoized by (series hash, config), where the hash covers the
+series so far. When a month is appended, the Backtest of the series minus
+that month is found in the cache and advanced by one update, instead of
+being refit from the first month. With more than one worker, series whose
+backtests are not cached are spread over a process pool in chunks; the
+pool is shut down after idle_timeout seconds without work, so the web
+server does not keep idle processes around.
+
+The bundled data is a few hundred synthetic monthly expense series,
+generated from a fixed seed (expense_series()).
+
+Only numpy is needed, to generate the data.
+
+    PORTFOLIO_FORECAST_WORKERS=4   backtest processes (default: 1, in process; capped at the CPUs this process may use)
+"""
+import os
+import copy
+import hashlib
+import threading
+import multiprocessing
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+HORIZON = 3  # months forecast at each origin
+MIN_TRAIN = 12  # months seen before the first origin
+# sched_getaffinity honours CPU pinning (and cgroup cpusets); cpu_count() does not
+AVAILABLE_CPUS = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+DEFAULT_WORKERS = max(1, min(int(os.environ.get("PORTFOLIO_FORECAST_WORKERS", "1")), AVAILABLE_CPUS))
+
+CATEGORIES = ("Utilities", "Rent", "Salaries", "Transport", "Supplies",
+              "Marketing", "Maintenance", "IT", "Travel", "Insurance")
+
+# -----------------------------
+# Data
+# -----------------------------
+# Monthly expenses per (branch, category): level, trend, yearly season, noise and the odd spike.
+# Returns (names, array of shape (series, months))
+def expense_series(branches=30, months=72, seed=11):
+    rng = np.random.default_rng(seed)
+    n = branches * len(CATEGORIES)
+    t = np.arange(months)
+    level = rng.lognormal(10.0, 0.8, (n, 1))
+    trend = rng.normal(0.004, 0.006, (n, 1))
+    season = rng.uniform(0.0, 0.25, (n, 1)) * np.sin(2 * np.pi * (t + rng.integers(0, 12, (n, 1))) / 12)
+    noise = rng.normal(0.0, rng.uniform(0.03, 0.15, (n, 1)), (n, months))
+    spikes = (rng.random((n, months)) < 0.02) * rng.uniform(0.3, 1.0, (n, months))
+    values = level * np.exp(trend * t) * (1 + season + noise + spikes)
+    names = [f"Branch {b + 1:02d} · {c}" for b in range(branches) for c in CATEGORIES]
+    return names, np.round(values, 2)
+
+# -----------------------------
+# Models — online: state = start(); update(state, y) for each month; forecast(state, h)
+# -----------------------------
+class MovingAverage:
+    def __init__(self, window):
+        self.window = window
+
+    def start(self):
+        return [deque(maxlen=self.window), 0.0]  # last values, their sum
+
+    def update(self, state, y):
+        values = state[0]
+        if len(values) == self.window:
+            state[1] -= values[0]
+        values.append(y)
+        state[1] += y
+
+    def forecast(self, state, h):
+        return [state[1] / len(state[0])] * h
+
+class ExpSmoothing:
+    def __init__(self, alpha):
+        self.alpha = alpha
+
+    def start(self):
+        return [None]  # level
+
+    def update(self, state, y):
+        state[0] = y if state[0] is None else self.alpha * y + (1 - self.alpha) * state[0]
+
+    def forecast(self, state, h):
+        return [state[0]] * h
+
+# Least squares on the last `window` months (all months when window is 0),
+# kept as running sums so an update is O(1)
+class LinearTrend:
+    def __init__(self, window):
+        self.window = window
+
+    def start(self):
+        return [deque(), 0, 0.0, 0.0, 0.0, 0.0, 0.0]  # values, t, n, Σt, Σy, Σt², Σty
+
+    def update(self, state, y):
+        values, t = state[0], state[1]
+        values.append((t, y))
+        state[2:] = [state[2] + 1, state[3] + t, state[4] + y, state[5] + t * t, state[6] + t * y]
+        if self.window and len(values) > self.window:
+            t0, y0 = values.popleft()
+            state[2:] = [state[2] - 1, state[3] - t0, state[4] - y0, state[5] - t0 * t0, state[6] - t0 * y0]
+        state[1] = t + 1
+
+    def forecast(self, state, h):
+        t, n, st, sy, stt, sty = state[1:]
+        denom = n * stt - st * st
+        slope = (n * sty - st * sy) / denom if denom else 0.0
+        intercept = (sy - slope * st) / n
+        return [intercept + slope * (t + k) for k in range(h)]
+
+CONFIGS = {
+    "MA(3)": MovingAverage(3),
+    "MA(6)": MovingAverage(6),
+    "MA(12)": MovingAverage(12),
+    "SES(0.2)": ExpSmoothing(0.2),
+    "SES(0.5)": ExpSmoothing(0.5),
+    "SES(0.8)": ExpSmoothing(0.8),
+    "Trend(12)": LinearTrend(12),
+    "Trend(24)": LinearTrend(24),
+    "Trend(all)": LinearTrend(0),
+}
+
+# -----------------------------
+# Backtests
+# -----------------------------
+class Backtest:
+    def __init__(self, config):
+        self.config = config
+        self.state = CONFIGS[config].start()
+        self.months = 0
+        self.pending = {}  # target month -> [(step, forecast)]
+        self.abs_err = [0.0] * HORIZON  # per step ahead
+        self.pct_err = [0.0] * HORIZON
+        self.scored = [0] * HORIZON
+
+    # Feed the next months of the series, scoring forecasts and forecasting as it goes
+    def extend(self, values):
+        model = CONFIGS[self.config]
+        for y in values:
+            month = self.months
+            for step, predicted in self.pending.pop(month, ()):
+                self.abs_err[step] += abs(y - predicted)
+                self.pct_err[step] += abs(y - predicted) / abs(y) if y else 0.0
+                self.scored[step] += 1
+            model.update(self.state, y)
+            self.months = month + 1
+            if self.months >= MIN_TRAIN:
+                for step, predicted in enumerate(model.forecast(self.state, HORIZON)):
+                    self.pending.setdefault(self.months + step, []).append((step, predicted))
+        return self
+
+    # Independent of this one, so a cached Backtest can be extended without changing it
+    def copy(self):
+        other = copy.copy(self)
+        other.state = [x.copy() if isinstance(x, deque) else x for x in self.state]
+        other.pending = {month: list(forecasts) for month, forecasts in self.pending.items()}
+        other.abs_err, other.pct_err, other.scored = self.abs_err[:], self.pct_err[:], self.scored[:]
+        return other
+
+    def mae(self):
+        scored = sum(self.scored)
+        return sum(self.abs_err) / scored if scored else float("nan")
+
+    def mape(self):
+        scored = sum(self.scored)
+        return sum(self.pct_err) / scored if scored else float("nan")
+
+    def forecast(self, h=HORIZON):
+        return CONFIGS[self.config].forecast(self.state, h)
+
+# Hash of every prefix of a series: prefix_hashes(y)[n] identifies y[:n]
+def prefix_hashes(values):
+    h = hashlib.blake2b(digest_size=16)
+    hashes = [h.digest()]
+    for v in values:
+        h.update(array("d", (v,)).tobytes())
+        hashes.append(h.digest())
+    return hashes
+
+# Runs in the pool: each job is (start Backtest or config name, months to feed)
+def _run_jobs(jobs):
+    return [(start if isinstance(start, Backtest) else Backtest(start)).extend(values) for start, values in jobs]
+
+class Forecaster:
+    def __init__(self, workers=DEFAULT_WORKERS, max_entries=20000, chunk_size=16, idle_timeout=60.0):
+        self.workers = workers
+        self.max_entries = max_entries
+        self.chunk_size = chunk_size  # series per pool task
+        self.idle_timeout = idle_timeout
+        self.hits = 0  # backtests found complete in the cache
+        self.extended = 0  # backtests advanced from a cached prefix
+        self.fitted = 0  # backtests run from the first month
+        self._cache = OrderedDict()  # (prefix hash, config) -> Backtest, least recently used first
+        self._lock = threading.Lock()
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._pool_users = 0
+        self._idle_timer = None
+
+    # Takes the pool (starting it if needed) for one backtest; pair with _release()
+    def _acquire(self):
+        with self._pool_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            if self._pool is None:
+                # spawn: forking a process that runs server threads is not safe
+                self._pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            self._pool_users += 1
+            return self._pool
+
+    def _release(self):
+        with self._pool_lock:
+            self._pool_users -= 1
+            if not self._pool_users:
+                self._idle_timer = threading.Timer(self.idle_timeout, self._shutdown_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def _shutdown_if_idle(self):
+        with self._pool_lock:
+            if self._pool_users or self._pool is None:
+                return
+            pool, self._pool, self._idle_timer = self._pool, None, None
+        pool.shutdown()
+
+    def _lookup(self, hashes, config):
+        for n in range(len(hashes) - 1, -1, -1):
+            found = self._cache.get((hashes[n], config))
+            if found is not None:
+                self._cache.move_to_end((hashes[n], config))
+                return n, found
+        return 0, None
+
+    # One Backtest per config for every series (rows of a 2-D array); returns
+    # [{config: Backtest}] in series order. Cached backtests are shared; don't extend them
+    def backtest(self, series, configs=tuple(CONFIGS)):
+        series = [list(map(float, row)) for row in series]
+        results = [{} for _ in series]
+        jobs = []  # (series index, config, start, values)
+        keys = []  # hash of each whole series
+        with self._lock:
+            for i, values in enumerate(series):
+                hashes = prefix_hashes(values)
+                keys.append(hashes[-1])
+                for config in configs:
+                    n, found = self._lookup(hashes, config)
+                    if n == len(values):
+                        results[i][config] = found
+                        self.hits += 1
+                    elif found is not None:
+                        jobs.append((i, config, found.copy(), values[n:]))
+                        self.extended += 1
+                    else:
+                        jobs.append((i, config, config, values))
+                        self.fitted += 1
+        if self.workers > 1 and len(jobs) > self.chunk_size * len(configs):
+            size = self.chunk_size * len(configs)
+            chunks = [jobs[k:k + size] for k in range(0, len(jobs), size)]
+            pool = self._acquire()
+            try:
+                done = [bt for part in pool.map(
+                    _run_jobs, [[(start, values) for _, _, start, values in chunk] for chunk in chunks]) for bt in part]
+            finally:
+                self._release()
+        else:
+            done = _run_jobs([(start, values) for _, _, start, values in jobs])
+        with self._lock:
+            for (i, config, _, _), bt in zip(jobs, done):
+                results[i][config] = bt
+                self._cache[(keys[i], config)] = bt
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return results
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            pool, self._pool, self._idle_timer = self._pool, None, None
+        if pool is not None:
+            pool.shutdown()
+
+# The config with the lowest backtest MAPE
+def best(backtests):
+    return min(backtests.values(), key=lambda bt: bt.mape())
@@ -0,0 +1,117 @@
+"""Background health checks and previews for the apps linked from project cards.
+
+LinkMonitor.get() never blocks: it returns the last known LinkStatus (or
+None before the first probe finishes) and, if that result is older than the
+TTL, schedules a refresh on the thread pool (stale-while-revalidate). A
+scheduler thread also re-probes every watched URL once per TTL, so statuses
+stay warm even when nobody is looking at the Projects page.
+
+Each probe is a GET with a short timeout that reads at most PREVIEW_BYTES of
+the response to pick out the page <title> and og:image thumbnail.
+"""
+import re
+import time
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
+from typing import NamedTuple
+
+PREVIEW_BYTES = 64 * 1024
+USER_AGENT = "portfolio-linkcheck/1.0"
+
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.I | re.S)
+_OG_IMAGE_RE = re.compile(rb"""<meta[^>]+property=["']og:image["'][^>]+content=["']([^"']+)""", re.I)
+
+class LinkStatus(NamedTuple):
+    url: str
+    ok: bool
+    status_code: int
+    elapsed_ms: float
+    checked_at: float
+    title: str = ""
+    thumbnail: str = ""
+    error: str = ""
+
+def probe(url, timeout=5.0):
+    start = time.perf_counter()
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            head = response.read(PREVIEW_BYTES)
+            code = response.status
+    except urllib.error.HTTPError as e:
+        return LinkStatus(url, False, e.code, (time.perf_counter() - start) * 1000, time.time(), error=str(e))
+    except Exception as e:
+        return LinkStatus(url, False, 0, (time.perf_counter() - start) * 1000, time.time(), error=str(e))
+    elapsed = (time.perf_counter() - start) * 1000
+    title = _TITLE_RE.search(head)
+    image = _OG_IMAGE_RE.search(head)
+    return LinkStatus(
+        url, 200 <= code < 400, code, elapsed, time.time(),
+        title=unescape(title.group(1).decode("utf-8", "replace").strip()) if title else "",
+        thumbnail=image.group(1).decode("utf-8", "replace") if image else "",
+    )
+
+class LinkMonitor:
+    def __init__(self, ttl=300.0, timeout=5.0, max_workers=4, probe_fn=probe):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.probe_fn = probe_fn
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="linkcheck")
+        self._lock = threading.Lock()
+        self._status = {}  # url -> LinkStatus
+        self._inflight = set()
+        self._scheduler = None
+        self._stop = threading.Event()
+
+    def _refresh(self, url):
+        try:
+            status = self.probe_fn(url, self.timeout)
+            with self._lock:
+                self._status[url] = status
+        finally:
+            with self._lock:
+                self._inflight.discard(url)
+
+    def _schedule(self, url):
+        with self._lock:
+            if url in self._inflight:
+                return
+            self._inflight.add(url)
+        try:
+            self._pool.submit(self._refresh, url)
+        except RuntimeError:
+            # Pool already shut down (stop() or interpreter exit)
+            with self._lock:
+                self._inflight.discard(url)
+
+    # Cached status for url (None until the first probe lands); never waits on the network
+    def get(self, url):
+        with self._lock:
+            status = self._status.get(url)
+            if status is None:
+                self._status.setdefault(url, None)
+        if status is None or time.time() - status.checked_at > self.ttl:
+            self._schedule(url)
+        return status
+
+    def watched(self):
+        with self._lock:
+            return list(self._status)
+
+    def _run(self):
+        while not self._stop.wait(self.ttl):
+            for url in self.watched():
+                self._schedule(url)
+
+    def start(self):
+        if self._scheduler is None:
+            self._scheduler = threading.Thread(target=self._run, name="linkcheck-scheduler", daemon=True)
+            self._scheduler.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._pool.shutdown(wait=False)
@@ -0,0 +1,108 @@
+"""Content items rendered to HTML: cards, testimonials, certifications, degrees and job bodies.
+
+The live app sends each item as one pre-rendered st.markdown element
+instead of a bordered container holding three or four elements, so a
+page's rerun sends a fraction of the deltas. The static export
+(export.py) uses the same renderers. Results are memoized per item, so a
+rerun only looks the HTML up.
+
+Only the Markdown subset content.json uses is supported: paragraphs,
+hard line breaks, "- " lists, headings, "> " quotes, links, bold and
+italics.
+"""
+import re
+from functools import lru_cache
+from html import escape
+
+# -----------------------------
+# Markdown — the subset content.json uses
+# -----------------------------
+def inline(text):
+    text = escape(text, quote=False)
+    text = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r'<a href="\2" target="_blank">\1</a>', text)
+    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
+    return re.sub(r"\*(.+?)\*", r"<em>\1</em>", text)
+
+def markdown_to_html(text):
+    html, para, items = [], [], []
+
+    def flush_para():
+        if para:
+            lines = [inline(line.strip()) + ("<br>" if line.endswith("  ") else "") for line in para]
+            html.append(f"<p>{' '.join(lines).removesuffix('<br>')}</p>")
+            para.clear()
+
+    def flush_items():
+        if items:
+            html.append("<ul>" + "".join(f"<li>{inline(item)}</li>" for item in items) + "</ul>")
+            items.clear()
+
+    for line in text.split("\n"):
+        stripped = line.strip()
+        heading = re.match(r"(#{1,6}) (.*)", stripped)
+        if not stripped:
+            flush_para()
+            flush_items()
+        elif stripped.startswith("- "):
+            flush_para()
+            items.append(stripped[2:])
+        elif heading:
+            flush_para()
+            flush_items()
+            level = len(heading.group(1))
+            html.append(f"<h{level}>{inline(heading.group(2))}</h{level}>")
+        elif stripped.startswith("> "):
+            flush_para()
+            flush_items()
+            html.append(f"<blockquote>{inline(stripped[2:])}</blockquote>")
+        else:
+            flush_items()
+            para.append(line.lstrip())
+    flush_para()
+    flush_items()
+    return "\n".join(html)
+
+# -----------------------------
+# Items — one HTML fragment each, memoized on (kind, item, badge)
+# -----------------------------
+def render_card(item, badge=""):
+    parts = [f"<h3>{inline(f'{item.icon} {item.title}' if item.icon else item.title)}</h3>"]
+    if item.subtitle or badge:
+        parts.append(f"<div class='subtitle'>{escape(item.subtitle)}{badge}</div>")
+    if item.body:
+        parts.append(markdown_to_html(item.body))
+    if item.link_url and item.link_text:
+        parts.append(f'<a class="button" href="{escape(item.link_url)}" target="_blank" rel="noopener">'
+                     f'{escape(item.link_text)}</a>')
+    return f"<div class='card'>{''.join(parts)}</div>"
+
+# The body of a job's expander (the app draws the expander itself)
+@lru_cache(maxsize=256)
+def render_job_body(item):
+    return f"<p class='caption'>{escape(item.period)}</p>{markdown_to_html(item.body)}"
+
+# Content items are NamedTuples of strings, so they are their own cache key.
+# badge is the link status HTML for cards (see components.link_badge)
+@lru_cache(maxsize=1024)
+def render_item(kind, item, badge=""):
+    if kind == "card":
+        return render_card(item, badge)
+    if kind == "skill":
+        return f"<div><h2>{inline(item.title)}</h2>{markdown_to_html(item.body)}</div>"
+    if kind == "job":
+        is_open = " open" if item.expanded else ""
+        return (f"<details{is_open}><summary>{escape(item.title)}</summary>"
+                f"{render_job_body(item)}</details>")
+    if kind == "degree":
+        return (f"<div class='card'><h3>{escape(item.title)}</h3>"
+                f"<p class='caption'>{escape(item.institution)}</p><p>{inline(item.detail)}</p></div>")
+    if kind == "testimonial":
+        return (f"<div class='card testimonial'><blockquote>\"{inline(item.quote)}\"</blockquote>"
+                f"<p><strong>— {escape(item.author)}</strong></p></div>")
+    if kind == "certification":
+        return (f"<div class='card'><h3>{inline(item.title)}</h3>"
+                f"<p class='caption'>{escape(item.issuer)}</p>{markdown_to_html(item.body)}</div>")
+    if kind == "metric":
+        return (f"<div class='metric' title='{escape(item.help)}'><div class='metric-label'>{escape(item.label)}</div>"
+                f"<div class='metric-value'>{escape(item.value)}</div></div>")
+    raise ValueError(f"Unknown content kind: {kind}")
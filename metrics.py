@@ -0,0 +1,154 @@
+"""In-process timing histograms and counters for the portfolio app.
+
+Spans time a block or function with perf_counter_ns and record the result
+in a fixed-bucket histogram; recording is one bisect and a few integer
+adds under a lock, about a microsecond per span. Everything is kept in
+memory for the life of the process and can be exported in the Prometheus
+text format, either from a local HTTP endpoint or as periodic log lines.
+
+    PORTFOLIO_METRICS_PORT=9464          serve http://127.0.0.1:9464/metrics
+    PORTFOLIO_METRICS_LOG_SECONDS=60     log a snapshot every 60 seconds
+"""
+import time
+import logging
+import threading
+import functools
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIX = "portfolio"
+
+# Upper bounds in milliseconds; the last bucket is +Inf
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_histograms = {}  # (name, labels) -> Histogram
+_counters = {}  # (name, labels) -> float
+
+class Histogram:
+    __slots__ = ("counts", "sum_ms", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.sum_ms = 0.0
+        self.count = 0
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items())) if labels else ()
+
+def _observe(key, ms):
+    index = bisect_left(BUCKETS_MS, ms)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = Histogram()
+        hist.counts[index] += 1
+        hist.sum_ms += ms
+        hist.count += 1
+
+def observe(name, ms, **labels):
+    _observe(_key(name, labels), ms)
+
+def inc(name, value=1, **labels):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+class Span:
+    __slots__ = ("key", "start")
+
+    def __init__(self, key):
+        self.key = key
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        _observe(self.key, (time.perf_counter_ns() - self.start) / 1e6)
+        return False
+
+def span(name, **labels):
+    return Span(_key(name, labels))
+
+# Decorator form of span(); the label key is built once, not per call
+def timed(name, **labels):
+    key = _key(name, labels)
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _observe(key, (time.perf_counter_ns() - start) / 1e6)
+        return wrapper
+    return decorator
+
+# -----------------------------
+# Export
+# -----------------------------
+def _labels(pairs, extra=()):
+    pairs = tuple(pairs) + tuple(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+def render_prometheus():
+    with _lock:
+        hists = {k: (list(h.counts), h.sum_ms, h.count) for k, h in _histograms.items()}
+        counters = dict(_counters)
+
+    lines = []
+    family = f"{PREFIX}_span_seconds"
+    if hists:
+        lines.append(f"# TYPE {family} histogram")
+    for (name, labels), (counts, sum_ms, count) in sorted(hists.items()):
+        pairs = (("span", name),) + labels
+        cumulative = 0
+        for bound, n in zip(BUCKETS_MS + (float("inf"),), counts):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else repr(bound / 1000)
+            lines.append(f"{family}_bucket{_labels(pairs, [('le', le)])} {cumulative}")
+        lines.append(f"{family}_sum{_labels(pairs)} {sum_ms / 1000:.6f}")
+        lines.append(f"{family}_count{_labels(pairs)} {count}")
+
+    seen = set()
+    for (name, labels), value in sorted(counters.items()):
+        metric = f"{PREFIX}_{name}_total"
+        if metric not in seen:
+            lines.append(f"# TYPE {metric} counter")
+            seen.add(metric)
+        lines.append(f"{metric}{_labels(labels)} {value:g}")
+    return "\n".join(lines) + "\n"
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_http_server(port, host="127.0.0.1"):
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+def start_log_snapshots(interval):
+    def run():
+        while True:
+            time.sleep(interval)
+            logger.info("metrics snapshot\n%s", render_prometheus())
+    threading.Thread(target=run, name="metrics-log", daemon=True).start()
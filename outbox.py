@@ -0,0 +1,230 @@
+"""Durable outbox for contact form submissions.
+
+enqueue() commits the message to a local SQLite database (WAL mode) and
+returns immediately. A background worker thread sends due messages in
+batches over SMTP, with exponential backoff on failure. A message the server
+rejects (a refused recipient, a 5xx on DATA), or one that cannot be built (a
+line break in a header field), is charged an attempt on its own; only a
+connection failure charges the rest of the batch. Every message has an
+idempotency key: enqueueing the same key twice stores one row, and the key
+is sent as the Message-ID so a retry after a crash can be deduplicated by
+the receiving side.
+
+Several workers can share one outbox file, each running its own delivery
+thread. A worker claims a batch before sending it, by pushing the rows'
+next_attempt a lease into the future in the same transaction that selects
+them, so no two workers send the same message. If a worker dies mid-send
+its rows become due again once the lease runs out.
+
+SMTP settings come from the environment (see smtp_config_from_env). Without
+CONTACT_SMTP_HOST, messages are kept in the outbox until one is configured.
+"""
+import os
+import time
+import uuid
+import random
+import logging
+import sqlite3
+import smtplib
+import threading
+from email.message import EmailMessage
+from email.utils import formataddr
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB = os.environ.get(
+    "CONTACT_OUTBOX_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "outbox.db")
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    idem_key TEXT NOT NULL UNIQUE,
+    created REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    message TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    sent_at REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (sent_at, next_attempt);
+"""
+
+class SmtpConfig(NamedTuple):
+    host: str
+    port: int = 25
+    username: str = ""
+    password: str = ""
+    use_tls: bool = False
+    sender: str = "portfolio@localhost"
+    recipient: str = "mujakkir.dv@gmail.com"
+    timeout: float = 10.0
+
+def smtp_config_from_env(environ=os.environ):
+    host = environ.get("CONTACT_SMTP_HOST")
+    if not host:
+        return None
+    return SmtpConfig(
+        host=host,
+        port=int(environ.get("CONTACT_SMTP_PORT", 25)),
+        username=environ.get("CONTACT_SMTP_USER", ""),
+        password=environ.get("CONTACT_SMTP_PASSWORD", ""),
+        use_tls=environ.get("CONTACT_SMTP_TLS", "") == "1",
+        sender=environ.get("CONTACT_FROM", SmtpConfig._field_defaults["sender"]),
+        recipient=environ.get("CONTACT_TO", SmtpConfig._field_defaults["recipient"]),
+    )
+
+class Outbox:
+    def __init__(self, db_path=DEFAULT_DB, smtp=None, batch_size=20, poll_interval=5.0,
+                 max_attempts=8, backoff_base=2.0, backoff_max=600.0, lease=300.0):
+        self.db_path = db_path
+        self.smtp = smtp
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease = lease  # seconds a claimed batch stays hidden from other workers
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+        self._connect().executescript(SCHEMA)
+
+    # One connection per thread; WAL lets the worker read while sessions write
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def enqueue(self, name, email, subject, message, key=None):
+        key = key or uuid.uuid4().hex
+        now = time.time()
+        self._connect().execute(
+            "INSERT OR IGNORE INTO outbox (idem_key, created, name, email, subject, message, next_attempt)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, now, name, email, subject or "", message, now),
+        )
+        self._wake.set()
+        return key
+
+    def pending(self):
+        return self._connect().execute(
+            "SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL AND attempts < ?", (self.max_attempts,)
+        ).fetchone()[0]
+
+    # Select due rows and lease them to this worker in one write transaction
+    def _claim_due(self, now):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT id, idem_key, name, email, subject, message, attempts FROM outbox"
+                " WHERE sent_at IS NULL AND attempts < ? AND next_attempt <= ? ORDER BY id LIMIT ?",
+                (self.max_attempts, now, self.batch_size),
+            ).fetchall()
+            conn.executemany("UPDATE outbox SET next_attempt = ? WHERE id = ?",
+                             [(now + self.lease, row[0]) for row in rows])
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return rows
+
+    def _build_email(self, row):
+        _, key, name, email, subject, message, _ = row
+        msg = EmailMessage()
+        msg["From"] = self.smtp.sender
+        msg["To"] = self.smtp.recipient
+        # formataddr quotes the name, so a name like "x <other@addr>" cannot change the address
+        msg["Reply-To"] = formataddr((name, email))
+        msg["Subject"] = f"[Portfolio] {subject or 'New message'}"
+        msg["Message-ID"] = f"<{key}@portfolio>"
+        msg.set_content(f"From: {formataddr((name, email))}\n\n{message}")
+        return msg
+
+    def _backoff(self, attempts):
+        delay = min(self.backoff_base ** attempts, self.backoff_max)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _mark_failed(self, rows, error):
+        now = time.time()
+        conn = self._connect()
+        for row in rows:
+            attempts = row[6] + 1
+            conn.execute(
+                "UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                (attempts, now + self._backoff(attempts), str(error)[:500], row[0]),
+            )
+
+    # A reply to this one message, or a message that cannot be built (EmailMessage
+    # raises ValueError for CR/LF in a header); anything else (a 421, a dropped
+    # connection) ends the batch
+    @staticmethod
+    def _rejected(error):
+        if isinstance(error, (smtplib.SMTPRecipientsRefused, ValueError)):
+            return True
+        return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code != 421
+
+    # Send one batch of due messages over a single SMTP connection; returns the number sent
+    def deliver_due(self):
+        if self.smtp is None:
+            return 0
+        rows = self._claim_due(time.time())
+        if not rows:
+            return 0
+        conn = self._connect()
+        sent = 0
+        handled = 0  # rows already marked sent or failed
+        try:
+            with smtplib.SMTP(self.smtp.host, self.smtp.port, timeout=self.smtp.timeout) as client:
+                if self.smtp.use_tls:
+                    client.starttls()
+                if self.smtp.username:
+                    client.login(self.smtp.username, self.smtp.password)
+                for row in rows:
+                    try:
+                        client.send_message(self._build_email(row))
+                    except (smtplib.SMTPException, ValueError) as e:
+                        if not self._rejected(e):
+                            raise
+                        self._mark_failed([row], e)
+                    else:
+                        conn.execute("UPDATE outbox SET sent_at = ? WHERE id = ?", (time.time(), row[0]))
+                        sent += 1
+                    handled += 1
+        except (smtplib.SMTPException, OSError) as e:
+            self._mark_failed(rows[handled:], e)
+        return sent
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                if self.deliver_due() == self.batch_size:
+                    continue  # more may be waiting
+            except Exception:
+                # Keep the thread alive; the rows are retried once their lease runs out
+                logger.exception("outbox delivery failed")
+            self._wake.wait(self.poll_interval)
+
+    def start(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._stop.clear()
+            self._worker = threading.Thread(target=self._run, name="contact-outbox", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self, timeout=5.0):
+        self._stop.set()
+        self._wake.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
@@ -0,0 +1,73 @@
+"""Rate limiting and duplicate suppression for the contact form.
+
+Each visitor session and each client IP gets a token bucket. A bucket is
+two floats, so memory is O(1) per key. Buckets live in an LRU ordered by
+last use: idle keys fall off the front, and the total number of keys is
+capped. A bounded LRU of message hashes drops exact resubmissions; a
+message that could not be stored is forgotten again, so it can be resent.
+
+Verdicts are counted by the caller, in metrics.py (views/contact.py).
+
+The buckets and hashes live in a sharedstate backend: in the process by
+default, or in a SQLite file shared by every worker when PORTFOLIO_STATE_DB
+is set, so limits hold across workers.
+
+Behind a reverse proxy or load balancer the peer address is the proxy's,
+and every visitor would share one IP bucket (10 messages, then one every
+30 s, for the whole site). Set the number of proxies in front of the app
+and the client IP is read from X-Forwarded-For instead (see client_ip):
+
+    PORTFOLIO_TRUSTED_PROXIES=1   proxies that append to X-Forwarded-For (default: 0, use the peer address)
+"""
+import os
+import hashlib
+import threading
+
+import sharedstate
+
+ACCEPTED = "accepted"
+THROTTLED = "throttled"
+DUPLICATE = "deduplicated"
+VERDICTS = (ACCEPTED, THROTTLED, DUPLICATE)
+
+TRUSTED_PROXIES = int(os.environ.get("PORTFOLIO_TRUSTED_PROXIES", "0"))
+
+# Each trusted proxy appends the address it saw, so the client is the entry
+# that many places from the right; anything further left is client-supplied.
+# Falls back to the peer address when the header is missing or too short
+def client_ip(peer, forwarded_for, trusted_proxies=TRUSTED_PROXIES):
+    if not trusted_proxies:
+        return peer
+    hops = [hop.strip() for hop in (forwarded_for or "").split(",") if hop.strip()]
+    return hops[-trusted_proxies] if len(hops) >= trusted_proxies else peer
+
+class ContactGuard:
+    def __init__(self, session_rate=1 / 60, session_burst=3, ip_rate=1 / 30, ip_burst=10,
+                 max_keys=10000, idle_ttl=3600.0, max_hashes=1000, clock=None, state=None):
+        self.session_limit = (session_rate, session_burst)
+        self.ip_limit = (ip_rate, ip_burst)
+        self.state = state or sharedstate.MemoryState(idle_ttl, max_keys, max_hashes)
+        self.clock = clock or self.state.clock
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def message_hash(name, email, subject, message):
+        text = "\x1f".join(part.strip().lower() for part in (name, email, subject or "", message))
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def check(self, session_id, ip, name, email, subject, message):
+        digest = self.message_hash(name, email, subject, message)
+        with self._lock:
+            now = self.clock()
+            if not self.state.take("session", session_id, *self.session_limit, now) \
+                    or (ip and not self.state.take("ip", ip, *self.ip_limit, now)):
+                verdict = THROTTLED
+            elif self.state.seen(digest, now):
+                verdict = DUPLICATE
+            else:
+                verdict = ACCEPTED
+        return verdict
+
+    # Undoes the hash check() recorded for an accepted message that was then not stored
+    def forget(self, name, email, subject, message):
+        self.state.forget(self.message_hash(name, email, subject, message))
@@ -0,0 +1,202 @@
+"""Data engine for the live Sales & Deposit demo on the Projects page.
+
+The dataset is a few million synthetic transactions (timestamp, executive,
+region, sales amount, amount deposited), generated once from a fixed seed
+and stored as Parquet:
+
+    python salesdemo.py                 # writes data/sales.parquet
+
+load() reads the file memory-mapped, with no compression to decode, into
+one NumPy array per column (executive and region as dictionary codes),
+and rolls the rows up once, with np.bincount, into sums per hour,
+executive and region. A month range is then a slice of that cube,
+executive and region filters are 0/1 weight vectors, and every group-by
+is a sum along one of its axes: a few milliseconds whatever the row
+count. summary() results are kept in a bounded LRU per filter
+combination, shared by every session.
+
+Time series are downsampled with LTTB (largest triangle three buckets)
+before they are returned, so a chart never gets more than max_points
+points whatever the date range.
+
+numpy and pyarrow are imported here, and only the demo imports this
+module.
+
+    PORTFOLIO_SALES_PARQUET=/path/sales.parquet   where the dataset lives
+    PORTFOLIO_SALES_ROWS=3000000                  rows to generate
+"""
+import os
+import threading
+from functools import lru_cache
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+DEFAULT_PATH = os.environ.get(
+    "PORTFOLIO_SALES_PARQUET", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sales.parquet")
+)
+DEFAULT_ROWS = int(os.environ.get("PORTFOLIO_SALES_ROWS", "3000000"))
+
+START = np.datetime64("2023-01-01T00:00:00", "s")
+MONTHS = 24
+EXECUTIVES = ("Arif", "Bushra", "Farhan", "Jannat", "Kamal", "Nadia", "Rafiq", "Sadia")
+REGIONS = ("Dhaka", "Chattogram", "Sylhet", "Khulna", "Rajshahi")
+
+# -----------------------------
+# Dataset
+# -----------------------------
+# First day of each month, plus the day after the last one
+def month_starts(months=MONTHS):
+    first = START.astype("datetime64[M]")
+    return np.arange(first, first + months + 1)
+
+# The same boundaries as seconds since START
+def month_bounds(months=MONTHS):
+    return (month_starts(months).astype("datetime64[s]") - START).astype(np.int64)
+
+def generate(rows=DEFAULT_ROWS, seed=7):
+    rng = np.random.default_rng(seed)
+    bounds = month_bounds()
+    # Mostly during working hours; busier towards the end of the year
+    hour_weights = np.where((np.arange(24) >= 9) & (np.arange(24) < 20), 1.0, 0.15)
+    ts = np.sort(rng.integers(0, bounds[-1] // 86400, rows) * 86400
+                 + rng.choice(24, rows, p=hour_weights / hour_weights.sum()) * 3600
+                 + rng.integers(0, 3600, rows))
+    month = np.searchsorted(bounds, ts, side="right") - 1
+    season = 1.0 + 0.35 * np.sin((month % 12 - 3) / 12 * 2 * np.pi)
+    weights = np.linspace(1.6, 0.6, len(EXECUTIVES))
+    executive = rng.choice(len(EXECUTIVES), rows, p=weights / weights.sum())
+    region = rng.choice(len(REGIONS), rows, p=[0.38, 0.24, 0.14, 0.13, 0.11])
+    amount = rng.lognormal(8.2, 0.7, rows) * season * (1 + 0.05 * executive)
+    deposited = amount * np.clip(rng.normal(0.86, 0.12, rows), 0.0, 1.0)
+    return pa.table({
+        "ts": pa.array(ts.astype(np.int32)),  # seconds since START
+        "executive": pa.DictionaryArray.from_arrays(executive.astype(np.int8), list(EXECUTIVES)),
+        "region": pa.DictionaryArray.from_arrays(region.astype(np.int8), list(REGIONS)),
+        "amount": pa.array(amount.astype(np.float32)),
+        "deposited": pa.array(deposited.astype(np.float32)),
+    })
+
+# Uncompressed and plain-encoded, so reading it back is a memory-mapped copy, not a decode
+def write(table, path=DEFAULT_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    pq.write_table(table, tmp_path, compression="none", use_dictionary=["executive", "region"],
+                   row_group_size=1 << 20)
+    os.replace(tmp_path, path)
+
+_generate_lock = threading.Lock()
+
+def ensure_dataset(path=DEFAULT_PATH, rows=DEFAULT_ROWS):
+    with _generate_lock:
+        if not os.path.exists(path):
+            write(generate(rows), path)
+    return path
+
+class SalesData:
+    # Rolls the rows up into sums per (hour, executive, region): amount,
+    # deposited and transaction count. Every filter and group-by then runs
+    # on that cube, whose size depends on the date range, not the row count
+    def __init__(self, ts, executive, region, amount, deposited, executives, regions, cache_size=256):
+        self.rows = len(ts)
+        self.executives = executives
+        self.regions = regions
+        self.months = month_starts()[:-1]
+        self.month_hours = month_bounds() // 3600  # month i is hours [month_hours[i], month_hours[i + 1])
+        shape = (int(self.month_hours[-1]), len(executives), len(regions))
+        cell = (ts // 3600 * shape[1] + executive) * shape[2] + region
+        size = shape[0] * shape[1] * shape[2]
+        self.cube = np.stack([
+            np.bincount(cell, weights=amount, minlength=size),
+            np.bincount(cell, weights=deposited, minlength=size),
+            np.bincount(cell, minlength=size).astype(np.float64),
+        ]).reshape((3,) + shape)
+        self.summary = lru_cache(maxsize=cache_size)(self._summary)
+
+    def __len__(self):
+        return self.rows
+
+    def _weights(self, selected, names):
+        if not selected:
+            return np.ones(len(names))
+        return np.isin(names, selected).astype(np.float64)
+
+    # Filters are hashable so summary() can be cached: tuples of names (empty
+    # means all) and an inclusive (first, last) month index range
+    def _summary(self, executives=(), regions=(), months=(0, MONTHS - 1), max_points=2000):
+        first, last = months
+        h0, h1 = int(self.month_hours[first]), int(self.month_hours[last + 1])
+        we, wr = self._weights(executives, self.executives), self._weights(regions, self.regions)
+        block = self.cube[:, h0:h1]
+        by_cell = block.sum(axis=1) * we[:, None] * wr  # (measure, executive, region)
+        hourly = (block[:2] @ wr) @ we  # (measure, hour): amount and deposited
+        by_month = np.add.reduceat(hourly, self.month_hours[first:last + 1] - h0, axis=1)
+        hours = START + np.arange(h0, h1) * np.timedelta64(3600, "s")
+        x, y = lttb(hours, hourly[0], max_points)
+        return {
+            "transactions": int(by_cell[2].sum()),
+            "sales": float(by_cell[0].sum()),
+            "deposited": float(by_cell[1].sum()),
+            "by_executive": (self.executives, by_cell[0].sum(axis=1), by_cell[1].sum(axis=1)),
+            "by_region": (self.regions, by_cell[0].sum(axis=0)),
+            "by_month": (self.months[first:last + 1], by_month[0], by_month[1]),
+            "hourly": (x, y),
+            "hourly_points": h1 - h0,
+        }
+
+# Columns come straight out of the memory-mapped file; only the cube is kept
+def load(path=DEFAULT_PATH):
+    table = pq.read_table(ensure_dataset(path), memory_map=True)
+
+    def codes(name):
+        column = table.column(name).combine_chunks()
+        return column.indices.to_numpy().astype(np.int64), tuple(column.dictionary.to_pylist())
+
+    executive, executives = codes("executive")
+    region, regions = codes("region")
+    return SalesData(
+        table.column("ts").to_numpy().astype(np.int64), executive, region,
+        table.column("amount").to_numpy(), table.column("deposited").to_numpy(), executives, regions,
+    )
+
+# -----------------------------
+# Downsampling
+# -----------------------------
+# Largest triangle three buckets: keeps the first and last points and, from
+# each of n_out - 2 equal buckets in between, the point forming the largest
+# triangle with the point kept before it and the next bucket's mean. The
+# bucket means are vectorized; the scan is over Python floats, which beats
+# a NumPy call per bucket of a handful of points
+def lttb(x, y, n_out):
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+    xf = np.asarray(x).astype(np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)  # bucket i is [edges[i], edges[i + 1])
+    counts = np.diff(edges)
+    mean_x = (np.add.reduceat(xf[1:n - 1], edges[:-1] - 1) / counts).tolist() + [xf[-1]]
+    mean_y = (np.add.reduceat(yf[1:n - 1], edges[:-1] - 1) / counts).tolist() + [yf[-1]]
+    xs, ys, edges = xf.tolist(), yf.tolist(), edges.tolist()
+    keep = [0]
+    a = 0
+    for i in range(n_out - 2):
+        ax, ay, cx, cy = xs[a], ys[a], mean_x[i + 1], mean_y[i + 1]
+        best = -1.0
+        for j in range(edges[i], edges[i + 1]):
+            area = abs((ax - cx) * (ys[j] - ay) - (ax - xs[j]) * (cy - ay))
+            if area > best:
+                best, a = area, j
+        keep.append(a)
+    keep.append(n - 1)
+    return x[keep], y[keep]
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    table = generate()
+    write(table)
+    print(f"{DEFAULT_PATH}: {table.num_rows:,} rows, {os.path.getsize(DEFAULT_PATH) / 1e6:,.1f} MB"
+          f" in {time.perf_counter() - start:.1f} s")
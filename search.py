@@ -0,0 +1,185 @@
+"""Full-text search over the portfolio content and the resume text.
+
+Every card, skill, job, testimonial, ... becomes one document, as does each
+page's free text and each page of resume.pdf. Documents are tokenized once
+into per-source segments (one per content page, one for the resume); an
+index keeps the segments it was built from, so a rebuild after an edit to
+content.json only re-tokenizes the pages whose records changed. The merged
+postings live in flat arrays: term id -> slice of (doc id, term frequency).
+
+Queries are ranked with BM25. A term with no exact match falls back to
+every indexed term it prefixes ("quickb" finds "quickbooks").
+
+Resume text needs the optional pypdf package; without it the resume is
+simply left out of the index.
+"""
+import re
+import math
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import NamedTuple
+
+# BM25 parameters (the usual defaults)
+K1 = 1.2
+B = 0.75
+
+# Shortest query term that is expanded by prefix
+MIN_PREFIX = 3
+
+SNIPPET_CHARS = 120
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Lone surrogates and private-use glyphs (icon fonts) that PDF extraction leaves behind
+_PDF_JUNK_RE = re.compile(r"[\ud800-\udfff-]")
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+class Document(NamedTuple):
+    page: str
+    title: str
+    text: str
+
+class Hit(NamedTuple):
+    page: str
+    title: str
+    snippet: str
+    score: float
+
+# -----------------------------
+# Documents
+# -----------------------------
+def _item_title(item):
+    for field in ("title", "label", "author"):
+        value = getattr(item, field, "")
+        if value:
+            return value
+    return ""
+
+def _item_text(item):
+    return " ".join(v for k, v in item._asdict().items() if isinstance(v, str) and k != "link_url")
+
+# One document per record, plus one for the page's free text (Home, Contact)
+def page_documents(name, page):
+    docs = []
+    if page.text:
+        docs.append(Document(name, page.title, " ".join(page.text.values())))
+    for group in page.groups:
+        for item in group.items:
+            docs.append(Document(name, _item_title(item) or page.title, _item_text(item)))
+    return docs
+
+# Text of each page of a PDF; () when pypdf is not installed or the file can't be read
+def extract_pdf_text(pdf_path):
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return ()
+    try:
+        pages = PdfReader(pdf_path).pages
+        return tuple(" ".join(_PDF_JUNK_RE.sub("", p.extract_text() or "").split()) for p in pages)
+    except Exception:
+        return ()
+
+# The resume is shown on the Home page, so its hits link there
+def resume_documents(page_texts, page="Home"):
+    return [Document(page, f"Resume · page {i}", text) for i, text in enumerate(page_texts, 1) if text]
+
+# -----------------------------
+# Index
+# -----------------------------
+class Segment(NamedTuple):
+    source: object  # what the documents were built from; compared by identity
+    docs: list
+    counts: list  # Counter of terms per document
+
+def build_segment(source, docs):
+    return Segment(source, docs, [Counter(tokenize(f"{d.title} {d.text}")) for d in docs])
+
+class SearchIndex:
+    def __init__(self, segments):
+        self.segments = segments  # key -> Segment
+        self.docs = []
+        term_docs = {}  # term -> [(doc id, tf)]
+        lengths = array("I")
+        for segment in segments.values():
+            for doc, counts in zip(segment.docs, segment.counts):
+                doc_id = len(self.docs)
+                self.docs.append(doc)
+                lengths.append(sum(counts.values()))
+                for term, tf in counts.items():
+                    term_docs.setdefault(term, []).append((doc_id, tf))
+
+        self.terms = sorted(term_docs)  # for prefix lookups
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+        self.offsets = array("I", [0])
+        self.doc_ids = array("I")
+        self.freqs = array("H")
+        for term in self.terms:
+            for doc_id, tf in term_docs[term]:
+                self.doc_ids.append(doc_id)
+                self.freqs.append(min(tf, 0xFFFF))
+            self.offsets.append(len(self.doc_ids))
+
+        n = len(self.docs)
+        avg = (sum(lengths) / n) if n else 1.0
+        # Per-document BM25 length normalisation, computed once
+        self.norms = array("d", (K1 * (1 - B + B * length / avg) for length in lengths))
+        self.idf = array("d", (
+            math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for df in (self.offsets[i + 1] - self.offsets[i] for i in range(len(self.terms)))
+        ))
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _expand(self, term):
+        term_id = self.term_ids.get(term)
+        if term_id is not None:
+            return [term_id]
+        if len(term) < MIN_PREFIX:
+            return []
+        ids = []
+        i = bisect_left(self.terms, term)
+        while i < len(self.terms) and self.terms[i].startswith(term):
+            ids.append(i)
+            i += 1
+        return ids
+
+    def search(self, query, limit=5):
+        terms = set(tokenize(query))
+        scores = {}
+        for term in terms:
+            for term_id in self._expand(term):
+                idf = self.idf[term_id]
+                for j in range(self.offsets[term_id], self.offsets[term_id + 1]):
+                    doc_id, tf = self.doc_ids[j], self.freqs[j]
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (K1 + 1) / (tf + self.norms[doc_id])
+        top = heapq.nlargest(limit, scores.items(), key=lambda kv: kv[1])
+        return [
+            Hit(doc.page, doc.title, snippet(doc.text, terms), score)
+            for doc, score in ((self.docs[doc_id], score) for doc_id, score in top)
+        ]
+
+# Reuses the segments of `previous` whose source object is unchanged
+def build_index(site, resume_pages=(), previous=None):
+    old = previous.segments if previous is not None else {}
+    sources = [(name, page, page_documents) for name, page in site.items()]
+    sources.append(("resume.pdf", resume_pages, lambda _, texts: resume_documents(texts)))
+    segments = {}
+    for key, source, make_docs in sources:
+        segment = old.get(key)
+        if segment is None or segment.source is not source:
+            segment = build_segment(source, make_docs(key, source))
+        segments[key] = segment
+    return SearchIndex(segments)
+
+# Window of text around the first query term that occurs in it
+def snippet(text, terms, width=SNIPPET_CHARS):
+    lower = text.lower()
+    positions = [p for p in (lower.find(t) for t in terms) if p >= 0]
+    start = max(0, min(positions) - width // 3) if positions else 0
+    text = " ".join(text[start:start + width].split())
+    return ("…" if start else "") + text + ("…" if start + width < len(lower) else "")
@@ -0,0 +1,187 @@
+"""Rate-limit state for the contact form, shared by one worker's sessions or by every worker.
+
+Two backends with the same methods:
+
+- MemoryState keeps token buckets and recent message hashes in the
+  process (the default). Each worker then enforces its own limits.
+- SQLiteState keeps them in one SQLite file in WAL mode, so any number of
+  worker processes on the host share them. Every update is a single
+  BEGIN IMMEDIATE transaction, so a bucket is never spent twice.
+
+take() spends a token from a bucket; seen() records a message hash and
+says whether it was already there, and forget() drops one again. Times
+are whatever clock the state says: monotonic in process, wall time in the file, since monotonic
+readings mean nothing after a reboot.
+
+The contact outbox and the analytics event log are SQLite files already,
+and the asset manifest is a file under static/; pointing every worker at
+the same paths shares them too (see README).
+
+    PORTFOLIO_STATE_DB=/path/state.db   share rate limits across workers (default: per process)
+"""
+import os
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+
+STATE_DB = os.environ.get("PORTFOLIO_STATE_DB", "")
+
+class TokenBuckets:
+    def __init__(self, rate, burst, idle_ttl=3600.0, max_keys=10000):
+        self.rate = rate  # tokens per second
+        self.burst = burst
+        self.idle_ttl = idle_ttl
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> [tokens, last_update]
+
+    def _evict(self, now):
+        while self._buckets:
+            key, (_, last) = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_keys and now - last < self.idle_ttl:
+                break
+            del self._buckets[key]
+
+    def allow(self, key, now):
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now]
+        else:
+            self._buckets.move_to_end(key)
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        self._evict(now)
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return True
+        return False
+
+    def __len__(self):
+        return len(self._buckets)
+
+class RecentHashes:
+    def __init__(self, max_entries=1000, ttl=3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._seen = OrderedDict()  # digest -> first seen
+
+    # True if the digest was seen within the TTL; otherwise records it
+    def check_and_add(self, digest, now):
+        first = self._seen.get(digest)
+        if first is not None and now - first < self.ttl:
+            self._seen.move_to_end(digest)
+            return True
+        self._seen[digest] = now
+        self._seen.move_to_end(digest)
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return False
+
+    def discard(self, digest):
+        self._seen.pop(digest, None)
+
+class MemoryState:
+    clock = staticmethod(time.monotonic)
+
+    def __init__(self, idle_ttl=3600.0, max_keys=10000, max_hashes=1000):
+        self.idle_ttl = idle_ttl
+        self.max_keys = max_keys
+        self._buckets = {}  # bucket name -> TokenBuckets
+        self._recent = RecentHashes(max_hashes, idle_ttl)
+        self._lock = threading.Lock()
+
+    def take(self, name, key, rate, burst, now):
+        with self._lock:
+            buckets = self._buckets.get(name)
+            if buckets is None:
+                buckets = self._buckets[name] = TokenBuckets(rate, burst, self.idle_ttl, self.max_keys)
+            return buckets.allow(key, now)
+
+    def seen(self, digest, now):
+        with self._lock:
+            return self._recent.check_and_add(digest, now)
+
+    def forget(self, digest):
+        with self._lock:
+            self._recent.discard(digest)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (name, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS buckets_updated ON buckets (updated);
+CREATE TABLE IF NOT EXISTS recent (
+    digest BLOB PRIMARY KEY,
+    first REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS recent_first ON recent (first);
+"""
+
+class SQLiteState:
+    clock = staticmethod(time.time)
+
+    # Idle buckets and old hashes expire after idle_ttl; the file has no key cap
+    def __init__(self, db_path, idle_ttl=3600.0):
+        self.db_path = db_path
+        self.idle_ttl = idle_ttl
+        self._local = threading.local()
+        self._connect().executescript(SCHEMA)
+
+    # One connection per thread, like outbox.Outbox
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # BEGIN IMMEDIATE takes the write lock up front, so read-modify-write is atomic across processes
+    def _transaction(self, fn):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    def take(self, name, key, rate, burst, now):
+        def spend(conn):
+            conn.execute("DELETE FROM buckets WHERE updated < ?", (now - self.idle_ttl,))
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE name = ? AND key = ?",
+                               (name, key)).fetchone()
+            tokens = float(burst) if row is None else min(burst, row[0] + max(0.0, now - row[1]) * rate)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            conn.execute("INSERT OR REPLACE INTO buckets (name, key, tokens, updated) VALUES (?, ?, ?, ?)",
+                         (name, key, tokens, now))
+            return allowed
+        return self._transaction(spend)
+
+    def seen(self, digest, now):
+        def check_and_add(conn):
+            conn.execute("DELETE FROM recent WHERE first < ?", (now - self.idle_ttl,))
+            if conn.execute("SELECT 1 FROM recent WHERE digest = ?", (digest,)).fetchone():
+                return True
+            conn.execute("INSERT INTO recent (digest, first) VALUES (?, ?)", (digest, now))
+            return False
+        return self._transaction(check_and_add)
+
+    def forget(self, digest):
+        self._connect().execute("DELETE FROM recent WHERE digest = ?", (digest,))
+
+# The backend PORTFOLIO_STATE_DB selects: the shared file if set, otherwise in process
+def from_env(db_path=None, **kwargs):
+    db_path = STATE_DB if db_path is None else db_path
+    if db_path:
+        return SQLiteState(db_path, idle_ttl=kwargs.get("idle_ttl", 3600.0))
+    return MemoryState(**kwargs)
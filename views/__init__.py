@@ -0,0 +1,10 @@
+"""One module per sidebar page, each exposing render().
+
+render_page() imports a page's module the first time that page is shown,
+so a session only pays for the pages it visits; later reruns reuse the
+module from sys.modules.
+"""
+import importlib
+
+def render_page(name):
+    importlib.import_module(f"views.{name.lower()}").render()
@@ -0,0 +1,70 @@
+"""Analytics page (hidden): visitor traffic recorded by analytics.py.
+
+Opened by URL only: ?page=Analytics&key=<PORTFOLIO_ANALYTICS_KEY>. Without
+that variable the page is off. pandas and Plotly are imported here, so
+other pages never load them.
+"""
+import os
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+import analytics
+from components import get_event_log
+
+# The aggregates are shared by every session and refreshed at most once a minute;
+# all the heavy lifting happens in vectorized group-bys over the event table
+@st.cache_resource(show_spinner="Aggregating events…", ttl=60)
+def load_summary(db_path, days):
+    since = (pd.Timestamp.now() - pd.Timedelta(days=days)).timestamp() if days else None
+    return analytics.summarize(analytics.load_events(db_path, since))
+
+def render():
+    key = os.environ.get("PORTFOLIO_ANALYTICS_KEY")
+    if not key or st.query_params.get("key") != key:
+        st.error("This page is not available.")
+        return
+
+    st.markdown("# 📈 Visitor Analytics")
+    days = st.segmented_control("Period", [7, 30, 90, 0], default=30,
+                                format_func=lambda d: f"{d} days" if d else "All time")
+    log = get_event_log()
+    if st.button("Refresh now"):
+        log.flush()
+        load_summary.clear()
+    summary = load_summary(log.db_path, days or 0)
+    totals = summary["totals"]
+
+    cols = st.columns(4)
+    cols[0].metric("Page views", f"{totals['page_views']:,}")
+    cols[1].metric("Visitors", f"{totals['visitors']:,}")
+    cols[2].metric("Resume downloads", f"{totals['downloads']:,}")
+    cols[3].metric("Events", f"{totals['events']:,}")
+    st.caption(
+        f"Aggregated {summary['generated_at']:%H:%M:%S} · {log.buffered():,} events waiting to be "
+        f"written · {log.dropped:,} dropped"
+    )
+    if not totals["events"]:
+        st.info("No events recorded yet.")
+        return
+
+    st.plotly_chart(
+        px.line(summary["daily_views"], x="day", y="views", color="page", title="Page views per day"),
+        width="stretch",
+    )
+    left, right = st.columns(2)
+    with left:
+        st.plotly_chart(
+            px.bar(summary["page_views"], x="views", y="page", orientation="h", title="Views by page"),
+            width="stretch",
+        )
+    with right:
+        st.plotly_chart(
+            px.bar(summary["events_by_hour"], x="hour", y="events", color="kind", title="Events by hour of day"),
+            width="stretch",
+        )
+    st.plotly_chart(
+        px.area(summary["daily_visitors"], x="day", y="visitors", title="Unique visitors per day"),
+        width="stretch",
+    )
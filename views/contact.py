@@ -0,0 +1,109 @@
+"""Contact page: the contact form and contact details.
+
+Submissions are checked by the rate limiter and queued in the outbox from
+the submit button's callback (see handle_contact_submit). The form is a
+fragment, so a submission reruns only the form.
+"""
+import streamlit as st
+
+import analytics
+import metrics
+import outbox
+import ratelimit
+import sharedstate
+from components import get_site, lite_mode, track, visitor_id
+
+# -----------------------------
+# Contact outbox — one per process; its worker thread delivers in the background
+# -----------------------------
+@st.cache_resource(show_spinner=False)
+def get_outbox():
+    return outbox.Outbox(outbox.DEFAULT_DB, outbox.smtp_config_from_env()).start()
+
+# Shared by every session: token buckets per session and per IP, plus recent message hashes.
+# With PORTFOLIO_STATE_DB set they live in that file and are shared by every worker too
+@st.cache_resource(show_spinner=False)
+def get_contact_guard():
+    return ratelimit.ContactGuard(state=sharedstate.from_env())
+
+# Runs as the submit button's callback, i.e. before the rerun, so rejected
+# submissions never touch the outbox; the page only shows the stored verdict
+@metrics.timed("handle_contact_submit")
+def handle_contact_submit():
+    state = st.session_state
+    name, email, subject, message = (
+        state.contact_name, state.contact_email, state.contact_subject, state.contact_message
+    )
+    if not name or not email or not message:
+        metrics.inc("contact_submissions", verdict="missing")
+        track(analytics.CONTACT_SUBMIT, "Contact", "missing")
+        state.contact_status = "missing"
+        return
+    ip = ratelimit.client_ip(st.context.ip_address, st.context.headers.get("X-Forwarded-For"))
+    guard = get_contact_guard()
+    verdict = guard.check(visitor_id(), ip, name, email, subject, message)
+    if verdict == ratelimit.ACCEPTED:
+        try:
+            # Stored durably here; the outbox worker sends the email
+            get_outbox().enqueue(name, email, subject, message)
+        except Exception as e:
+            # Not stored, so a resubmission must not count as a duplicate
+            guard.forget(name, email, subject, message)
+            verdict = f"Sorry, your message could not be saved ({e}). Please email me directly."
+    label = verdict if verdict in ratelimit.VERDICTS else "error"
+    metrics.inc("contact_submissions", verdict=label)
+    track(analytics.CONTACT_SUBMIT, "Contact", label)
+    state.contact_status = verdict
+
+# A fragment: submitting reruns only the form, not the sidebar, CSS and footer
+@st.fragment
+def contact_form():
+    visitor_id()
+    with st.form("contact_form", clear_on_submit=True):
+        st.text_input("Your Name*", placeholder="Enter your full name", key="contact_name")
+        st.text_input("Your Email*", placeholder="Enter your email address", key="contact_email")
+        st.text_input("Subject", placeholder="What is this regarding?", key="contact_subject")
+        st.text_area("Message*", placeholder="Your message here...", height=150, key="contact_message")
+        st.form_submit_button("Send Message", type="primary", on_click=handle_contact_submit)
+
+        status = st.session_state.pop("contact_status", None)
+        if status == "missing":
+            st.error("Please fill in all required fields (*)")
+        elif status == ratelimit.ACCEPTED:
+            st.success("Thanks for your message! I'll get back to you soon.")
+            if not lite_mode():
+                st.balloons()
+        elif status == ratelimit.DUPLICATE:
+            st.info("Thanks — this message was already received.")
+        elif status == ratelimit.THROTTLED:
+            st.warning("You're sending messages too quickly. Please wait a minute and try again.")
+        elif status:
+            st.error(status)
+
+def render():
+    contact = get_site()["Contact"]
+    st.markdown(f"# {contact.title}")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.write(contact.text["intro"])
+
+        contact_form()
+
+    with col2:
+        st.markdown(f"### {contact.text['details_title']}")
+        st.markdown(contact.text["details"])
+
+        # Social media links with icons
+        st.markdown("### Follow Me")
+        st.markdown("""
+        <div>
+            <a href="https://linkedin.com/in/mujakkir-dv" target="_blank" style="text-decoration: none; margin-right: 15px;">
+                <span style="font-size: 1.5rem;">🔗</span> LinkedIn
+            </a>
+            <a href="https://github.com/mujakkirdv" target="_blank" style="text-decoration: none;">
+                <span style="font-size: 1.5rem;">💻</span> GitHub
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
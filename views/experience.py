@@ -0,0 +1,5 @@
+"""Experience page, rendered from its section of content.json."""
+from components import render_section
+
+def render():
+    render_section("Experience")
@@ -0,0 +1,38 @@
+"""Home page: profile images and resume on the left, introduction on the right.
+
+The text is sent first. The left column starts as light placeholders, sized
+like the media they stand for, and the images and resume preview replace
+them once the introduction, "Why Choose Me" and KPI metrics are out, so the
+time to the first line of text no longer waits on the slowest media.
+"""
+import streamlit as st
+
+from components import PROFILE_IMG_1, PROFILE_IMG_2, RESUME_PDF
+from components import display_image, display_resume_download, get_site, media_placeholder, render_groups
+
+def render_media(slots):
+    with slots[0].container():
+        display_image(PROFILE_IMG_1, "Mujakkir Ahmad")
+    with slots[1].container():
+        display_resume_download(RESUME_PDF)
+    with slots[2].container():
+        display_image(PROFILE_IMG_2, "Mujakkir Ahmad")
+
+def render():
+    home = get_site()["Home"]
+    left, right = st.columns([1, 2], gap="large")
+    with left:
+        slots = [media_placeholder("image"), media_placeholder("resume"), media_placeholder("image")]
+
+    with right:
+        st.markdown(f"# {home.title}")
+        st.markdown(home.text["intro"])
+
+        # Value Proposition / Why Choose Me
+        st.markdown(f"## {home.text['why_title']}")
+        st.markdown(home.text["why"])
+
+        # Quick KPI counters
+        render_groups(home.groups)
+
+    render_media(slots)
@@ -0,0 +1,148 @@
+"""Projects page, rendered from its section of content.json, plus two live demos.
+
+The Sales & Deposit demo runs over a few million synthetic transactions
+(see salesdemo.py); the Expense Forecasting demo backtests a few hundred
+expense series (see forecast.py). Each is a fragment behind a toggle:
+until a visitor opens it, the page loads neither its data nor NumPy and
+Plotly, and using it reruns only that demo.
+"""
+import time
+from collections import Counter
+
+import streamlit as st
+
+import metrics
+from components import render_section
+
+# -----------------------------
+# Sales & deposits
+# -----------------------------
+# One copy of the data for the whole process; summary() caches per filter combination
+@st.cache_resource(show_spinner="Loading the transactions…")
+def get_sales_data():
+    import salesdemo
+
+    return salesdemo.load()
+
+def _chart(fig, title):
+    fig.update_layout(title=title, height=320, margin=dict(l=10, r=10, t=40, b=10),
+                      legend=dict(orientation="h", y=-0.2))
+    st.plotly_chart(fig, width="stretch")
+
+@st.fragment
+def sales_demo():
+    st.markdown("## 📈 Live Demo: Sales & Deposit Analysis")
+    if not st.toggle("Open the demo", key="sales_demo_open"):
+        st.caption("Three million synthetic transactions, filtered and aggregated live.")
+        return
+    import plotly.graph_objects as go
+    from salesdemo import MONTHS
+
+    data = get_sales_data()
+    cols = st.columns([2, 2, 3])
+    executives = cols[0].multiselect("Executives", data.executives, key="sales_executives", placeholder="All")
+    regions = cols[1].multiselect("Regions", data.regions, key="sales_regions", placeholder="All")
+    months = cols[2].select_slider("Months", options=range(MONTHS), value=(0, MONTHS - 1), key="sales_months",
+                                   format_func=lambda i: str(data.months[i]))
+    with metrics.span("sales_demo"):
+        summary = data.summary(tuple(sorted(executives)), tuple(sorted(regions)), tuple(months))
+
+    cols = st.columns(4)
+    cols[0].metric("Sales", f"৳{summary['sales'] / 1e6:,.1f}M")
+    cols[1].metric("Deposited", f"৳{summary['deposited'] / 1e6:,.1f}M")
+    cols[2].metric("Deposit ratio", f"{summary['deposited'] / summary['sales']:.1%}" if summary["sales"] else "—")
+    cols[3].metric("Transactions", f"{summary['transactions']:,}")
+
+    x, y = summary["hourly"]
+    _chart(go.Figure(go.Scattergl(x=x, y=y, mode="lines", line=dict(width=1))),
+           f"Hourly sales ({len(x):,} of {summary['hourly_points']:,} points, LTTB)")
+    cols = st.columns(3)
+    with cols[0]:
+        names, sales, deposited = summary["by_executive"]
+        _chart(go.Figure([go.Bar(x=names, y=sales, name="Sales"), go.Bar(x=names, y=deposited, name="Deposited")]),
+               "By executive")
+    with cols[1]:
+        names, sales = summary["by_region"]
+        _chart(go.Figure(go.Bar(x=names, y=sales, name="Sales")), "Sales by region")
+    with cols[2]:
+        months, sales, deposited = summary["by_month"]
+        labels = [str(m) for m in months]
+        _chart(go.Figure([go.Bar(x=labels, y=sales, name="Sales"), go.Bar(x=labels, y=deposited, name="Deposited")]),
+               "By month")
+
+# -----------------------------
+# Expense forecasting
+# -----------------------------
+FORECAST_FIRST_MONTHS = 48  # months shown before any are appended
+
+# One Forecaster per process, so every session extends the same cached backtests
+@st.cache_resource(show_spinner=False)
+def get_forecaster():
+    import forecast
+
+    return forecast.Forecaster()
+
+@st.cache_resource(show_spinner=False)
+def get_expense_series():
+    import forecast
+
+    return forecast.expense_series()
+
+def _append_month():
+    st.session_state["forecast_months"] += 1
+
+@st.fragment
+def forecast_demo():
+    st.markdown("## 🔮 Live Demo: Expense Forecasting")
+    if not st.toggle("Open the demo", key="forecast_demo_open"):
+        st.caption("Three hundred monthly expense series, nine models each, backtested from every month.")
+        return
+    import numpy as np
+    import plotly.graph_objects as go
+    import forecast
+
+    names, series = get_expense_series()
+    months = st.session_state.setdefault("forecast_months", FORECAST_FIRST_MONTHS)
+    cols = st.columns([3, 1])
+    name = cols[0].selectbox("Series", names, key="forecast_series")
+    cols[1].button("Append next month", on_click=_append_month, disabled=months >= series.shape[1],
+                   width="stretch")
+
+    forecaster = get_forecaster()
+    before = (forecaster.fitted, forecaster.extended, forecaster.hits)
+    start = time.perf_counter()
+    with metrics.span("forecast_demo"):
+        results = forecaster.backtest(series[:, :months])
+    elapsed = time.perf_counter() - start
+    fitted, extended, hits = (now - then for now, then in zip(
+        (forecaster.fitted, forecaster.extended, forecaster.hits), before))
+    st.caption(f"{len(names)} series × {len(forecast.CONFIGS)} models, rolling-origin backtests over {months} months"
+               f" in {elapsed * 1000:,.0f} ms: {fitted:,} fitted, {extended:,} extended by new months,"
+               f" {hits:,} from cache")
+
+    index = names.index(name)
+    backtests = results[index]
+    best = forecast.best(backtests)
+    dates = np.datetime64("2020-01", "M") + np.arange(months + forecast.HORIZON)
+    fig = go.Figure([
+        go.Scatter(x=dates[:months], y=series[index, :months], name="Actual"),
+        go.Scatter(x=dates[months - 1:], y=[series[index, months - 1]] + best.forecast(),
+                   name=f"Forecast, {best.config}", line=dict(dash="dash")),
+    ])
+    _chart(fig, f"{name}: next {forecast.HORIZON} months")
+
+    left, right = st.columns(2)
+    with left:
+        st.dataframe(
+            {"Model": list(backtests), "MAE": [round(bt.mae()) for bt in backtests.values()],
+             "MAPE": [f"{bt.mape():.1%}" for bt in backtests.values()]},
+            hide_index=True, width="stretch",
+        )
+    with right:
+        wins = Counter(forecast.best(r).config for r in results)
+        _chart(go.Figure(go.Bar(x=list(wins), y=list(wins.values()))), "Best model, by number of series")
+
+def render():
+    render_section("Projects")
+    sales_demo()
+    forecast_demo()